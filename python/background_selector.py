@@ -243,7 +243,8 @@ class BackgroundSelector(tk.Frame):
                 path = os.path.join(base_dir, filename)
                 try:
                     img = Image.open(path)
-                    img = img.resize(img_size, Image.Resampling.BILINEAR)
+                    # reducing_gap lets Pillow box-reduce large frames before the filter pass
+                    img = img.resize(img_size, Image.Resampling.BILINEAR, reducing_gap=2.0)
                     photo = ImageTk.PhotoImage(img)
 
                     # Frame around image for border effect
@@ -14,27 +14,40 @@
 
 
 import os
+import re
 import io
 import sys
 import tkinter as tk
 from tkinter import ttk, filedialog, colorchooser, font, simpledialog, Button
 import themed_messagebox as messagebox
 from themed_messagebox import ThemedAboutBox
+from background_selector import BackgroundSelector
 from datetime import datetime
 from PIL import Image, ImageTk, ImageDraw, ImageFont
 import subprocess
 import time
 import json
+import functools
 import cProfile
 import pstats
-import queue
 import threading
+import traceback
+import types
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 import lcd_driver
 from collections import deque
 from version import __version__
 from pathlib import Path
 
 READY_TIMEOUT = 30  # seconds
+DEFAULT_FONT_CONFIG = {"family": "DejaVu Sans", "size": 20, "style": "normal"}
+_styles_configured = False  # ttk.Style is process-wide, so configure it only once
+_MODULE_DEFAULTS = (  # (module, default metric) in button grid order
+    ("M1", "cpu_temp"), ("M2", "cpu_percent"), ("M3", "cpu_freq"),
+    ("M4", "gpu_temp"), ("M5", "gpu_usage"), ("M6", "gpu_clock"),
+)
+_MODULE_NAMES = tuple(name for name, _ in _MODULE_DEFAULTS)
 
 
 def wait_for_lcd_ready(lcd_driver):
@@ -63,8 +76,9 @@ import sys
 import os
 from pathlib import Path
 
+@functools.lru_cache(maxsize=None)
 def get_resource_base():
-    """Get the base directory where USBLCD is located"""
+    """Get the base directory where USBLCD is located (computed once; the layout doesn't change at runtime)"""
     if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
         # PyInstaller bundle
         return sys._MEIPASS
@@ -85,6 +99,7 @@ def get_resource_base():
             return str(script_dir)
 
 
+@functools.lru_cache(maxsize=256)
 def make_relative_path(absolute_path):
     """
     Convert absolute path to relative path from USBLCD
@@ -95,11 +110,20 @@ def make_relative_path(absolute_path):
     if not absolute_path:
         return ""
 
-    path_obj = Path(absolute_path)
-    parts = path_obj.parts
+    # Fast path: plain string scan for the last "USBLCD/" path component,
+    # normalised the same way as the fallback below
+    marker = "USBLCD" + os.sep
+    idx = absolute_path.rfind(os.sep + marker)
+    if idx >= 0:
+        return str(Path(absolute_path[idx + 1:]))
+    if absolute_path.startswith(marker):
+        return str(Path(absolute_path))
+
+    # Fallback for paths the string scan can't handle (e.g. trailing USBLCD, other separators)
+    parts = Path(absolute_path).parts
 
     try:
-        usblcd_index = parts.index("USBLCD")
+        usblcd_index = len(parts) - 1 - parts[::-1].index("USBLCD")
         relative_parts = parts[usblcd_index:]
         return str(Path(*relative_parts))
     except (ValueError, IndexError):
@@ -107,25 +131,71 @@ def make_relative_path(absolute_path):
         return absolute_path
 
 
+_ABSOLUTE_PATHS = {}  # relative path -> resolved absolute path; misses are never stored
+
+
 def make_absolute_path(relative_path):
     """
     Convert relative path to absolute path for current environment
 
     Input: USBLCD/images/013e/01.png
     Output: /tmp/_MEIxxxxxx/USBLCD/images/013e/01.png (or appropriate path)
+
+    Paths that resolved are cached; a missing file is checked again on every call so it
+    is picked up once it appears.
     """
     if not relative_path:
         return ""
 
+    cached = _ABSOLUTE_PATHS.get(relative_path)
+    if cached is not None:
+        return cached
+
     # If already absolute and exists, return as-is
-    if os.path.isabs(relative_path) and os.path.exists(relative_path):
-        return relative_path
+    if os.path.isabs(relative_path) and os.path.lexists(relative_path):
+        full_path = relative_path
+    else:
+        # Build absolute path
+        full_path = os.path.join(get_resource_base(), relative_path)
+        if not os.path.lexists(full_path):
+            return ""
+
+    _ABSOLUTE_PATHS[relative_path] = full_path
+    return full_path
 
-    # Build absolute path
-    base = get_resource_base()
-    full_path = os.path.join(base, relative_path)
 
-    return full_path if os.path.exists(full_path) else ""
+_NO_CONF = types.MappingProxyType({})  # read-only default for config.get() in the render paths
+# Directives that change within a minute, including flagged/width/E/O forms like %-S or %EX
+_SUBMINUTE_DIRECTIVE = re.compile(r"%[-_0^#]?[0-9]*[EO]?[STXcrsf+]")
+
+
+def _strftime(moment, fmt):
+    text = moment.strftime(fmt)
+    # Formats may use a literal "\\n" for a line break; only scan for it when present
+    if '\\n' in fmt:
+        text = text.replace('\\n', '\n')
+    return text
+
+
+@functools.lru_cache(maxsize=16)
+def _strftime_minute(fmt, minute):
+    return _strftime(datetime.fromtimestamp(minute * 60), fmt)
+
+
+def format_now(fmt):
+    """strftime for the current time, with "\\n" turned into a real line break.
+
+    Formats without seconds are only rendered once per minute.
+    """
+    if _SUBMINUTE_DIRECTIVE.search(fmt):
+        return _strftime(datetime.now(), fmt)
+    return _strftime_minute(fmt, int(time.time() // 60))
+
+
+@functools.lru_cache(maxsize=8)
+def _is_vendor_background(bg_path):
+    """True for vendor theme images that already include labels/units."""
+    return "/002" in bg_path or "/vendor/" in bg_path
 
 
 class ConfigManagerWrapper:
@@ -144,13 +214,10 @@ class ConfigManagerWrapper:
         # Convert absolute paths to relative
         for field in self.path_fields:
             if field in config_copy and config_copy[field]:
-                old_path = config_copy[field]
-                new_path = make_relative_path(config_copy[field])
-                config_copy[field] = new_path
+                config_copy[field] = make_relative_path(config_copy[field])
 
-        # Update the internal config data first
-        for key, value in config_copy.items():
-            self.config_manager.update_config_value(key, value)
+        # Update the internal config data first, in one call into the driver
+        self.config_manager.update_config_bulk(config_copy)
 
         # Then save to file
         return self.config_manager.save_config(path)
@@ -232,7 +299,7 @@ class ConfigManagerWrapper:
 class DarkFileBrowser(tk.Toplevel):
     def __init__(self, parent, title="Select File", filetypes=None, initialdir=None):
         super().__init__(parent)
-        self.title(title)
+        self.parent = parent
         self.configure(bg="#2b2b2b")
         self.geometry("600x400")
         self.minsize(500, 350)  # Minimum size to show all elements
@@ -241,19 +308,61 @@ class DarkFileBrowser(tk.Toplevel):
         self.filetypes = filetypes or [("All files", "*.*")]
         self.current_dir = initialdir or os.path.expanduser("~")
 
+        # Directory scans run on a small pool; stale results are dropped by generation
+        self._pool = ThreadPoolExecutor(max_workers=2)
+        self._load_generation = 0
+        # (path, extensions) -> (monotonic time, rows) so quick re-opens skip the rescan
+        self._listing_cache = {}
+        self._closed = tk.BooleanVar(self, value=False)
+        # Release show() if the window goes away some other way (app quit, parent destroyed)
+        self.bind("<Destroy>", lambda e: e.widget is self and self._closed.set(True))
+
         self.setup_ui()
-        self.load_directory(self.current_dir)
 
-        # Make modal
+        # The dialog is hidden rather than destroyed so it can be reused
         self.transient(parent)
-        self.grab_set()
+        self.protocol("WM_DELETE_WINDOW", self.on_cancel)
+        self.reset(title, filetypes, initialdir)
+
+    def reset(self, title="Select File", filetypes=None, initialdir=None):
+        """Prepare the dialog for another use"""
+        self.title(title)
+        self.result = None
+        self.filetypes = filetypes or [("All files", "*.*")]
+        display_filetypes = self._display_filetypes()
+        self.filetype_menu.configure(values=display_filetypes)
+        self.filetype_var.set(display_filetypes[0])
+        self.filename_entry.delete(0, tk.END)
+        self.load_directory(initialdir or os.path.expanduser("~"))
+
+    def show(self):
+        """Show the dialog modally and return the selected path (or None)"""
+        self._closed.set(False)
+        self.deiconify()
 
         # Center on parent
         self.update_idletasks()
-        x = parent.winfo_x() + (parent.winfo_width() - self.winfo_width()) // 2
-        y = parent.winfo_y() + (parent.winfo_height() - self.winfo_height()) // 2
+        x = self.parent.winfo_x() + (self.parent.winfo_width() - self.winfo_width()) // 2
+        y = self.parent.winfo_y() + (self.parent.winfo_height() - self.winfo_height()) // 2
         self.geometry(f"+{x}+{y}")
-    
+
+        # Make modal
+        try:
+            self.grab_set()
+        except Exception:
+            pass
+        self.wait_variable(self._closed)
+        return self.result
+
+    def _close(self):
+        self.grab_release()
+        self.withdraw()
+        self._closed.set(True)
+
+    def _display_filetypes(self):
+        display_filetypes = [f"{desc} ({pattern})" for desc, pattern in self.filetypes]
+        return [str(ft).strip("{}") for ft in display_filetypes]
+
     def setup_ui(self):
         # Style configuration
         style = ttk.Style()
@@ -336,14 +445,13 @@ class DarkFileBrowser(tk.Toplevel):
         tk.Label(filter_frame, text="Files of type:", bg="#2b2b2b", fg="white",
                 font=("Arial", 10)).pack(side=tk.LEFT, padx=5)
 
-        display_filetypes = [f"{desc} ({pattern})" for desc, pattern in self.filetypes]
-        display_filetypes = [str(ft).strip("{}") for ft in display_filetypes]
+        display_filetypes = self._display_filetypes()
         self.filetype_var = tk.StringVar(value=display_filetypes[0])
-        filetype_menu = ttk.Combobox(filter_frame, textvariable=self.filetype_var,
+        self.filetype_menu = ttk.Combobox(filter_frame, textvariable=self.filetype_var,
                                     values=display_filetypes,
                                     state='readonly', width = 150)
-        filetype_menu.pack(side=tk.LEFT, padx=5)
-        filetype_menu.bind('<<ComboboxSelected>>', lambda e: self.refresh())
+        self.filetype_menu.pack(side=tk.LEFT, padx=5)
+        self.filetype_menu.bind('<<ComboboxSelected>>', lambda e: self.refresh())
 
         # Buttons
         button_frame = tk.Frame(self, bg="#2b2b2b")
@@ -381,38 +489,70 @@ class DarkFileBrowser(tk.Toplevel):
                     extensions = ft_pattern.replace('*', '').split()
                     break
 
-            # List directories first, then files
-            items = []
-            try:
-                for entry in os.scandir(path):
-                    try:
-                        stat = entry.stat()
-                        size = self.format_size(stat.st_size) if entry.is_file() else ""
-                        modified = self.format_time(stat.st_mtime)
-                        
-                        # Filter files by extension
-                        if entry.is_file() and extensions:
-                            if not any(entry.name.lower().endswith(ext.lower()) for ext in extensions):
-                                continue
+            self._load_generation += 1
+            generation = self._load_generation
 
-                        items.append((entry.is_dir(), entry.name, size, modified))
-                    except (PermissionError, OSError):
-                        continue
-            except PermissionError:
-                pass
-
-            # Sort: directories first, then by name
-            items.sort(key=lambda x: (not x[0], x[1].lower()))
+            key = (path, tuple(extensions))
+            cached = self._listing_cache.get(key)
+            if cached and time.monotonic() - cached[0] < 5.0:
+                self._populate_tree(cached[1], generation, key)
+                return
 
-            # Add to tree
-            for is_dir, name, size, modified in items:
-                icon = "📁" if is_dir else "📄"
-                self.tree.insert('', 'end', text=f"{icon} {name}",
-                               values=(size, modified))
+            # Scan on a worker thread so large directories don't block the dialog
+            future = self._pool.submit(self._scan_directory, path, extensions)
+            future.add_done_callback(lambda f, g=generation, k=key: self._deliver_scan(f, g, k))
 
         except Exception as e:
             pass
 
+    def _scan_directory(self, path, extensions):
+        """List and stat a directory (runs on a worker thread)"""
+        # List directories first, then files
+        items = []
+        try:
+            for entry in os.scandir(path):
+                try:
+                    stat = entry.stat()
+                    size = self.format_size(stat.st_size) if entry.is_file() else ""
+                    modified = self.format_time(stat.st_mtime)
+
+                    # Filter files by extension
+                    if entry.is_file() and extensions:
+                        if not any(entry.name.lower().endswith(ext.lower()) for ext in extensions):
+                            continue
+
+                    items.append((entry.is_dir(), entry.name, size, modified))
+                except (PermissionError, OSError):
+                    continue
+        except PermissionError:
+            pass
+
+        # Sort: directories first, then by name
+        items.sort(key=lambda x: (not x[0], x[1].lower()))
+        return items
+
+    def _deliver_scan(self, future, generation, key):
+        """Hand a finished scan back to the Tk thread"""
+        try:
+            items = future.result()
+            self.after(0, lambda: self._populate_tree(items, generation, key))
+        except Exception:
+            # Scan failed or the dialog has already been destroyed
+            pass
+
+    def _populate_tree(self, items, generation, key):
+        if generation != self._load_generation:
+            return  # A newer directory load has started
+
+        if key not in self._listing_cache or self._listing_cache[key][1] is not items:
+            self._listing_cache[key] = (time.monotonic(), items)
+
+        # Add to tree
+        for is_dir, name, size, modified in items:
+            icon = "📁" if is_dir else "📄"
+            self.tree.insert('', 'end', text=f"{icon} {name}",
+                           values=(size, modified))
+
     def format_size(self, size):
         for unit in ['B', 'KB', 'MB', 'GB']:
             if size < 1024.0:
@@ -421,8 +561,13 @@ class DarkFileBrowser(tk.Toplevel):
         return f"{size:.1f} TB"
 
     def format_time(self, timestamp):
-        from datetime import datetime
-        return datetime.fromtimestamp(timestamp).strftime('%Y-%m-%d %H:%M')
+        # Only minutes are displayed, so rows modified in the same minute share one string
+        return self._format_minute(int(timestamp // 60))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _format_minute(minute):
+        return time.strftime('%Y-%m-%d %H:%M', time.localtime(minute * 60))
 
     def go_up(self):
         parent = os.path.dirname(self.current_dir)
@@ -430,6 +575,7 @@ class DarkFileBrowser(tk.Toplevel):
             self.load_directory(parent)
 
     def refresh(self):
+        self._listing_cache.clear()
         self.load_directory(self.current_dir)
 
     def on_double_click(self, event):
@@ -463,41 +609,102 @@ class DarkFileBrowser(tk.Toplevel):
         filename = self.filename_entry.get()
         if filename:
             self.result = os.path.join(self.current_dir, filename)
-            self.destroy()
+            self._close()
 
     def on_cancel(self):
         self.result = None
-        self.destroy()
+        self._close()
+
+    def destroy(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        super().destroy()
+
+
+_shared_browser = None  # DarkFileBrowser reused across askopenfilename calls
 
 
 def askopenfilename(parent=None, title="Select File", filetypes=None, initialdir=None):
     """
     Dark-themed file dialog replacement for filedialog.askopenfilename()
     """
-    dialog = DarkFileBrowser(parent or tk._default_root, title, filetypes, initialdir)
-    dialog.wait_window()
-    return dialog.result or ""
+    global _shared_browser
+    if _shared_browser is None or not _shared_browser.winfo_exists():
+        _shared_browser = DarkFileBrowser(parent or tk._default_root, title, filetypes, initialdir)
+    else:
+        _shared_browser.reset(title, filetypes, initialdir)
+    return _shared_browser.show() or ""
+
+
+def _prewarm_directories(paths):
+    """List and stat each directory so the OS caches are hot when the file browser opens"""
+    for path in paths:
+        try:
+            for entry in os.scandir(path):
+                try:
+                    entry.stat()
+                except OSError:
+                    continue
+        except OSError:
+            continue
+
+
+_font_families = None  # Tk font families, enumerated once per process
+
+
+def _get_font_families():
+    """Return the sorted, de-duplicated Tk font families as a tuple (cached after the first call)"""
+    global _font_families
+    if _font_families is None:
+        try:
+            # "@" names are vertical-text variants on Windows, not usable families
+            _font_families = tuple(sorted({f for f in font.families() if not f.startswith("@")}))
+        except Exception:
+            return ("DejaVu Sans", "Liberation Sans", "Arial", "Helvetica")
+    return _font_families
+
+
+@functools.lru_cache(maxsize=64)
+def _color_to_hex(color):
+    """Resolve a Tk colour (name or hex) to #rrggbb; winfo_rgb is slow so results are cached"""
+    if color.startswith("#") and len(color) == 7:
+        return color
+    try:
+        r, g, b = tk._default_root.winfo_rgb(color)
+    except Exception:
+        return None
+    return f"#{r >> 8:02x}{g >> 8:02x}{b >> 8:02x}"
+
 
 class DraggableTextPillow:
     """A Pillow-based draggable text item."""
     _font_cache = {}
+    _dirty_items = weakref.WeakSet()
+    _update_scheduled = False
+    _style_editor = None  # shared style editor Toplevel, built on first use
 
     def __init__(self, tag, text, x, y, font_config, color, update_callback):
         self.tag = tag
-        self.text = text
+        self.text = text.replace('\\n', '\n')  # stored with real newlines
+        self._lines = self.text.split('\n')
         self.x = x
         self.y = y
         self.font_config = font_config
         self.color = color
+        style = font_config.get("style", "normal")
         self.style = {
-            "style": font_config.get("style", "normal"),
-            "weight": "bold" if "bold" in font_config.get("style", "") else "normal",
-            "slant": "italic" if "italic" in font_config.get("style", "") else "roman",
+            "style": style,
+            "weight": "bold" if "bold" in style else "normal",
+            "slant": "italic" if "italic" in style else "roman",
         }
         self.update_callback = update_callback
         self.dragging = False
         self._pil_font = None
         self._last_font_config = None
+        # Caches are shared by the Tk and render threads, so each one stores the
+        # (lines, font) it was built from and is only used while both still match
+        self._size = None  # cached (lines, font, (width, height)) of the text block
+        self._line_offsets = None  # cached (lines, font, y offset of each line)
+        self._stamp = None  # cached (lines, font, (dx, dy, mask)) of the rendered text block
 
     def find_font_path(self, family: str, style: str = "normal") -> str | None:
         """
@@ -616,28 +823,30 @@ class DraggableTextPillow:
 
     @classmethod
     def get_font(cls, font_config):
-        """Static method for getting fonts (legacy compatibility)"""
-        key = (font_config['family'], font_config['size'], font_config.get('style', 'normal'))
+        """Return a shared PIL font for font_config, loading it on first use"""
+        size = font_config.get('size', 24)
+        family = font_config.get('family', 'DejaVu Sans')
+        style = font_config.get('style', 'normal')
+        key = (family, size, style)
         if key not in cls._font_cache:
             try:
                 # If family looks like a path, use it directly
-                family = font_config['family']
                 if os.path.exists(family) and (family.endswith('.ttf') or family.endswith('.otf')):
-                    cls._font_cache[key] = ImageFont.truetype(family, font_config['size'])
+                    cls._font_cache[key] = ImageFont.truetype(family, size)
                 else:
                     # Try to find the font
                     instance = cls("temp", "", 0, 0, font_config, "#000000", None)
-                    font_path = instance.find_font_path(family, font_config.get('style', 'normal'))
+                    font_path = instance.find_font_path(family, style)
 
                     if font_path and os.path.exists(font_path):
-                        cls._font_cache[key] = ImageFont.truetype(font_path, font_config['size'])
+                        cls._font_cache[key] = ImageFont.truetype(font_path, size)
                     else:
                         # Try fallback fonts
                         fallback_fonts = instance.get_fallback_fonts()
                         font_loaded = False
                         for fallback in fallback_fonts:
                             try:
-                                cls._font_cache[key] = ImageFont.truetype(fallback, font_config['size'])
+                                cls._font_cache[key] = ImageFont.truetype(fallback, size)
                                 font_loaded = True
                                 print(f"Using fallback font: {fallback}")
                                 break
@@ -654,110 +863,105 @@ class DraggableTextPillow:
 
         return cls._font_cache[key]
 
+    @classmethod
+    def preload_fonts(cls, font_configs):
+        """Load every font in font_configs up front so the first draw doesn't stall on fc-list"""
+        for font_config in font_configs:
+            cls.get_font(font_config)
+
     def _get_font(self):
         """Return cached PIL font, reload if config changed."""
-        if self._pil_font is None or (self._last_font_config and self.font_config != self._last_font_config):
+        if self._pil_font is None or self.font_config != self._last_font_config:
             self._last_font_config = self.font_config.copy()
-            size = self.font_config.get("size", 24)
-            family = self.font_config.get("family", "DejaVu Sans")
-            style = self.font_config.get("style", "normal")
-
-            font_path = None
-
-            # If family is already a path, use it directly
-            if os.path.exists(family) and (family.endswith('.ttf') or family.endswith('.otf')):
-                font_path = family
-            else:
-                # Try to find the font
-                font_path = self.find_font_path(family, style)
-
-            # Try to load the font
-            try:
-                if font_path and os.path.exists(font_path):
-                    self._pil_font = ImageFont.truetype(font_path, size)
-                else:
-                    # Try fallback fonts
-                    fallback_fonts = self.get_fallback_fonts()
-                    font_loaded = False
-                    
-                    for fallback in fallback_fonts:
-                        try:
-                            self._pil_font = ImageFont.truetype(fallback, size)
-                            print(f"Using fallback font: {fallback}")
-                            font_loaded = True
-                            break
-                        except Exception as e:
-                            print(f"Failed to load fallback {fallback}: {e}")
-                            continue
-
-                    if not font_loaded:
-                        self._pil_font = ImageFont.load_default()
-                        print("Using PIL default font")
-
-            except Exception as e:
-                print(f"Font loading error: {e}")
-                self._pil_font = ImageFont.load_default()
+            self._pil_font = DraggableTextPillow.get_font(self.font_config)
+            self._size = None
+            self._line_offsets = None
+            self._stamp = None
 
         return self._pil_font
 
 
     def draw(self, image_draw: ImageDraw.Draw):
         pil_font = self._get_font()
-        self.text = self.text.replace('\\n', '\n')
-        # Split text by newlines and draw each line
-        lines = self.text.split('\n')
-        y_offset = self.y
-
-        for line in lines:
-            image_draw.text((self.x, y_offset), line, font=pil_font, fill=self.color)
-
-            # Calculate line height and move down for next line
-            bbox = image_draw.textbbox((0, 0), line, font=pil_font)
-            line_height = bbox[3] - bbox[1]
-            y_offset += line_height + 2
+        # Stamp the pre-rendered glyph mask in the item's colour; no FreeType work per frame
+        dx, dy, mask = self._get_stamp(image_draw, pil_font)
+        if mask is not None:
+            image_draw.bitmap((self.x + dx, self.y + dy), mask, fill=self.color)
+
+
+    def _get_stamp(self, image_draw, pil_font):
+        """Return (dx, dy, mask) for the text block, rasterising only after text or font changes."""
+        lines = self._lines
+        cached = self._stamp
+        if cached is None or cached[0] is not lines or cached[1] is not pil_font:
+            offsets = self._get_line_offsets(image_draw, pil_font, lines)
+            placed = [(line, dy) for line, dy in zip(lines, offsets) if line]
+            if not placed:
+                stamp = (0, 0, None)
+            else:
+                boxes = [image_draw.textbbox((0, dy), line, font=pil_font) for line, dy in placed]
+                left = min(b[0] for b in boxes)
+                top = min(b[1] for b in boxes)
+                width = max(b[2] for b in boxes) - left
+                height = max(b[3] for b in boxes) - top
+                mask = Image.new("L", (max(1, width), max(1, height)), 0)
+                mask_draw = ImageDraw.Draw(mask)
+                mask_draw.fontmode = image_draw.fontmode
+                for line, dy in placed:
+                    mask_draw.text((-left, dy - top), line, font=pil_font, fill=255)
+                stamp = (left, top, mask)
+            cached = (lines, pil_font, stamp)
+            self._stamp = cached
+        return cached[2]
+
+
+    def _get_line_offsets(self, image_draw, pil_font, lines):
+        """Return each line's y offset, measuring only after text or font changes."""
+        cached = self._line_offsets
+        if cached is None or cached[0] is not lines or cached[1] is not pil_font:
+            offsets = []
+            y_offset = 0
+            for line in lines:
+                offsets.append(y_offset)
+                # Calculate line height and move down for next line
+                bbox = image_draw.textbbox((0, 0), line, font=pil_font)
+                y_offset += bbox[3] - bbox[1] + 2
+            cached = (lines, pil_font, tuple(offsets))
+            self._line_offsets = cached
+        return cached[2]
 
 
     def contains(self, px, py):
-        pil_font = self._get_font()  # Use instance method instead of class method
-        try:
-            # getbbox returns (x0, y0, x1, y1)
-            bbox = pil_font.getbbox(self.text)
-            width = bbox[2] - bbox[0]
-            height = bbox[3] - bbox[1]
-            return self.x <= px <= self.x + width and self.y <= py <= self.y + height
-        except Exception:
-            # Fallback for older PIL versions or default fonts
-            try:
-                width, height = pil_font.getsize(self.text)
-                return self.x <= px <= self.x + width and self.y <= py <= self.y + height
-            except Exception:
-                # Ultimate fallback - assume reasonable text size
-                estimated_width = len(self.text) * (self.font_config.get("size", 24) * 0.6)
-                estimated_height = self.font_config.get("size", 24)
-                return self.x <= px <= self.x + estimated_width and self.y <= py <= self.y + estimated_height
+        width, height = self._get_size()
+        return self.x <= px <= self.x + width and self.y <= py <= self.y + height
 
 
-    def _measure_text_block(self, text, font):
-        """Measure multi-line text (width, height) using the given font."""
-        text = text.replace('\\n', '\n')
+    def _get_size(self):
+        """Return the (width, height) of the text block, measuring only after text or font changes."""
+        pil_font = self._get_font()
+        lines = self._lines
+        cached = self._size
+        if cached is None or cached[0] is not lines or cached[1] is not pil_font:
+            cached = (lines, pil_font, self._measure_text_block(lines, pil_font))
+            self._size = cached
+        return cached[2]
+
 
-        lines = text.split("\n")
+    def _measure_text_block(self, lines, font):
+        """Measure multi-line text (width, height) from its lines using the given font."""
         max_width = 0
         total_height = 0
 
         for line in lines:
             if not line:
                 # Empty line still contributes roughly one line height
-                line_height = font.getsize("A")[1]
-                total_height += line_height
+                bbox = font.getbbox("A")
+                total_height += bbox[3] - bbox[1]
                 continue
 
-            try:
-                bbox = font.getbbox(line)
-                width = bbox[2] - bbox[0]
-                height = bbox[3] - bbox[1]
-            except Exception:
-                width, height = font.getsize(line)
+            bbox = font.getbbox(line)
+            width = bbox[2] - bbox[0]
+            height = bbox[3] - bbox[1]
 
             max_width = max(max_width, width)
             total_height += height
@@ -767,54 +971,95 @@ class DraggableTextPillow:
 
     def move(self, dx, dy, max_width=320, max_height=240, margin=5, update_lcd=True):
         """Move item with bounds checking (multi-line aware)."""
-        pil_font = self._get_font()
-        text_w, text_h = self._measure_text_block(self.text, pil_font)
+        text_w, text_h = self._get_size()
 
         # Clamp coordinates so text stays fully visible
         self.x = max(margin, min(self.x + dx, max_width - text_w - margin))
         self.y = max(margin, min(self.y + dy, max_height - text_h - margin))
     
-        if update_lcd and self.update_callback:
-            self.update_callback()
+        if update_lcd:
+            self._request_update()
 
 
     def move_without_callback(self, dx, dy, max_width=320, max_height=240, margin=5):
         """Move item silently (used during drag) – multi-line aware."""
-        pil_font = self._get_font()
-        text_w, text_h = self._measure_text_block(self.text, pil_font)
+        text_w, text_h = self._get_size()
 
         self.x = max(margin, min(self.x + dx, max_width - text_w - margin))
         self.y = max(margin, min(self.y + dy, max_height - text_h - margin))
 
 
     def update_text(self, text, trigger_callback=True):
-        self.text = text
-        if trigger_callback and self.update_callback:
-            self.update_callback()
+        text = text.replace('\\n', '\n')
+        if text != self.text:
+            # Lines before text: the render thread keys frames on text, so it must
+            # never see the new text while still drawing the old lines
+            self._lines = text.split('\n')
+            self.text = text
+            self._size = None
+            self._line_offsets = None
+            self._stamp = None
+        if trigger_callback:
+            self._request_update()
 
 
     def update_style(self, font_config=None, color=None):
         if font_config:
             self.font_config = font_config
             self._pil_font = None  # Force reload next draw
+            self._size = None
+            self._line_offsets = None
+            self._stamp = None
         if color:
             self.color = color
-        if self.update_callback:
-            self.update_callback()
+        self._request_update()
 
 
     def apply_style(self):
-        if self.update_callback:
+        self._request_update()
+
+
+    def _request_update(self):
+        """Mark this item dirty and schedule one update_callback per Tk idle cycle"""
+        if not self.update_callback:
+            return
+        cls = DraggableTextPillow
+        root = tk._default_root
+        if root is None:
             self.update_callback()
+            return
+        cls._dirty_items.add(self)
+        if not cls._update_scheduled:
+            cls._update_scheduled = True
+            root.after_idle(cls._flush_updates)
 
 
-    def _centre_window(self, window, parent=None):
-        """Centre a window on its parent or screen"""
-        window.update_idletasks()
+    @classmethod
+    def _flush_updates(cls):
+        """Run each distinct callback of the dirty items once"""
+        cls._update_scheduled = False
+        callbacks = []
+        for item in list(cls._dirty_items):
+            if item.update_callback and item.update_callback not in callbacks:
+                callbacks.append(item.update_callback)
+        cls._dirty_items.clear()
+        for callback in callbacks:
+            callback()
+
+
+    def _centre_window(self, window, parent=None, size=None):
+        """Centre a window on its parent or screen
+
+        If size (width, height) is given it is used as-is, skipping the forced layout pass.
+        """
+        if size:
+            window_width, window_height = size
+        else:
+            window.update_idletasks()
 
-        # Get window dimensions
-        window_width = window.winfo_width()
-        window_height = window.winfo_height()
+            # Get window dimensions
+            window_width = window.winfo_width()
+            window_height = window.winfo_height()
 
         # If parent exists, centre on parent
         if parent:
@@ -833,26 +1078,63 @@ class DraggableTextPillow:
             x = (screen_width - window_width) // 2
             y = (screen_height - window_height) // 2
 
-        window.geometry(f"+{x}+{y}")
+        if size:
+            window.geometry(f"{window_width}x{window_height}+{x}+{y}")
+        else:
+            window.geometry(f"+{x}+{y}")
 
 
     def open_style_editor(self, parent=None):
-        popup = tk.Toplevel(parent or self.canvas)
+        # One editor window is shared by all items; it is hidden, not destroyed, on close
+        popup = DraggableTextPillow._style_editor
+        if popup is None or not popup.winfo_exists():
+            popup = self._build_style_editor(parent or self.canvas)
+            DraggableTextPillow._style_editor = popup
+
+        # Point the editor at this item
+        popup.target = self
         popup.title(f"Edit Style: {self.tag}")
+        popup.font_var.set(self.font_config.get("family", "DejaVu Sans"))
+        popup.size_var.set(self.font_config.get("size", 14))
+        popup.style_var.set(self.font_config.get("style", "normal"))
+        popup.color_var.set(self.color)
+        popup.closed.set(False)
+
+        # Make modal and centre
+        popup.deiconify()
+        popup.transient(parent)
+        self._centre_window(popup, parent, popup.editor_size)
+        if popup.editor_size is None:
+            # Layout is fixed (and was just flushed by _centre_window), so measure once
+            popup.editor_size = (popup.winfo_reqwidth(), popup.winfo_reqheight())
+        try:
+            popup.grab_set()
+        except Exception:
+            # If grab fails (e.g., another modal is active), continue anyway
+            pass
+        popup.wait_variable(popup.closed)
+
+
+    @staticmethod
+    def _build_style_editor(master):
+        """Create the style editor window; open_style_editor fills it in for each item."""
+        popup = tk.Toplevel(master)
         popup.configure(bg="#2b2b2b")
         popup.columnconfigure(1, weight=1)  # make column 1 stretch
+        popup.target = None
+        popup.editor_size = None
+        popup.last_color = None  # last colour returned by the chooser
+        popup.closed = tk.BooleanVar(popup, value=False)
+        # Release open_style_editor's wait if the editor is torn down with its parent
+        popup.bind("<Destroy>", lambda e: e.widget is popup and popup.closed.set(True))
 
         # --- Font family
         tk.Label(popup, text="Font:", fg="white", bg="#2b2b2b").grid(
             row=0, column=0, sticky="w", padx=5, pady=5
         )
-        font_var = tk.StringVar(value=self.font_config.get("family", "DejaVu Sans"))
+        font_var = tk.StringVar(popup)
 
-        # Get available font families
-        try:
-            available_families = list(font.families())
-        except Exception:
-            available_families = ["DejaVu Sans", "Liberation Sans", "Arial", "Helvetica"]
+        available_families = _get_font_families()
 
         font_combo = ttk.Combobox(popup, textvariable=font_var, values=available_families)
         font_combo.grid(row=0, column=1, padx=5, pady=5, sticky="ew")
@@ -861,7 +1143,7 @@ class DraggableTextPillow:
         tk.Label(popup, text="Size:", fg="white", bg="#2b2b2b").grid(
             row=1, column=0, sticky="w", padx=5, pady=5
         )
-        size_var = tk.IntVar(value=self.font_config.get("size", 14))
+        size_var = tk.IntVar(popup)
         size_spin = tk.Spinbox(popup, from_=8, to=72, textvariable=size_var)
         size_spin.grid(row=1, column=1, padx=5, pady=5, sticky="ew")
 
@@ -869,7 +1151,7 @@ class DraggableTextPillow:
         tk.Label(popup, text="Style:", fg="white", bg="#2b2b2b").grid(
             row=2, column=0, sticky="w", padx=5, pady=5
         )
-        style_var = tk.StringVar(value=self.font_config.get("style", "normal"))
+        style_var = tk.StringVar(popup)
         style_menu = ttk.Combobox(popup, textvariable=style_var, values=["normal", "bold", "italic", "bold italic"])
         style_menu.grid(row=2, column=1, padx=5, pady=5, sticky="ew")
 
@@ -877,16 +1159,39 @@ class DraggableTextPillow:
         tk.Label(popup, text="Color:", fg="white", bg="#2b2b2b").grid(
             row=3, column=0, sticky="w", padx=5, pady=5
         )
-        color_var = tk.StringVar(value=self.color)
+        color_var = tk.StringVar(popup)
         color_entry = tk.Entry(popup, textvariable=color_var)
         color_entry.grid(row=3, column=1, padx=5, pady=5, sticky="ew")
 
-        def pick_color(self, color_var, popup):
-            color = colorchooser.askcolor(parent=popup, color=self.color)[1]
+        popup.font_var = font_var
+        popup.size_var = size_var
+        popup.style_var = style_var
+        popup.color_var = color_var
+
+        # Mirror the fields into a plain dict as they change, so apply() needs no Tcl round-trips
+        popup.pending_style = {}
+
+        def track(key, var):
+            def on_write(*args):
+                try:
+                    popup.pending_style[key] = var.get()
+                except tk.TclError:
+                    pass  # e.g. half-typed size; keep the last valid value
+            var.trace_add("write", on_write)
+
+        track("family", font_var)
+        track("size", size_var)
+        track("style", style_var)
+        track("color", color_var)
+
+        def pick_color():
+            initial = _color_to_hex(color_var.get()) or popup.last_color
+            color = colorchooser.askcolor(parent=popup, color=initial)[1]
             if color:
+                popup.last_color = color
                 color_var.set(color)
 
-        color_btn = tk.Button(popup, text="Pick", command=lambda: pick_color(self, color_var, popup))
+        color_btn = tk.Button(popup, text="Pick", command=pick_color)
         color_btn.grid(row=3, column=2, padx=5, pady=5)
 
         # --- Button frame
@@ -895,46 +1200,61 @@ class DraggableTextPillow:
 
 
         def apply():
-            self.font_config["family"] = font_var.get()
-            self.font_config["size"] = size_var.get()
-            self.font_config["style"] = style_var.get()
-            self.color = color_var.get()
-            self.update_style(self.font_config, self.color)
+            target = popup.target
+            pending = popup.pending_style
+            target.font_config["family"] = pending["family"]
+            target.font_config["size"] = pending["size"]
+            target.font_config["style"] = pending["style"]
+            target.color = pending["color"]
+            target.update_style(target.font_config, target.color)
+
+
+        def close():
+            popup.grab_release()
+            popup.withdraw()
+            popup.closed.set(True)
 
 
         def apply_and_close():
             apply()
-            popup.destroy()
+            close()
 
         # Buttons
         save_btn = tk.Button(button_frame, text="Apply", bg="#4CAF50", fg="white", activebackground="#45A049", activeforeground="white", underline=0, command=apply)
         save_btn.pack(side="left", padx=5)
-        cancel_btn = tk.Button(button_frame, text="Cancel", bg="#f44336", fg="white", activebackground="#da190b", activeforeground="white", underline=0, command=popup.destroy)
+        cancel_btn = tk.Button(button_frame, text="Cancel", bg="#f44336", fg="white", activebackground="#da190b", activeforeground="white", underline=0, command=close)
         cancel_btn.pack(side="left", padx=5)
         reset_btn = tk.Button(button_frame, text="OK", bg="#008CBA", fg="white", activebackground="#007bb5", activeforeground="white", underline=0, command=apply_and_close)
         reset_btn.pack(side="left", padx=5)
 
         # Shortcuts
         popup.bind("<Control-a>", lambda e: apply_and_close())
-        popup.bind("<Control-c>", lambda e: popup.destroy())
+        popup.bind("<Control-c>", lambda e: close())
         popup.bind("<Control-o>", lambda e: reset_to_default())
+        popup.protocol("WM_DELETE_WINDOW", close)
+
+        return popup
+
+
+@functools.lru_cache(maxsize=32)
+def _rounded_rect_points(x1, y1, x2, y2, radius):
+    """Flat polygon coords for a smoothed rounded rectangle."""
+    return (x1, y1+radius, x1, y1, x1+radius, y1,
+            x2-radius, y1, x2, y1, x2, y1+radius,
+            x2, y2-radius, x2, y2, x2-radius, y2,
+            x1+radius, y2, x1, y2, x1, y2-radius)
 
-        # Make modal and centre
-        popup.transient(parent)
-        self._centre_window(popup, parent)
-        popup.update_idletasks()
-        try:
-            popup.grab_set()
-        except Exception:
-            # If grab fails (e.g., another modal is active), continue anyway
-            pass
-        popup.wait_window()
 
 class ModernToggleSwitch(tk.Canvas):
     """Custom toggle switch widget matching TRCC style"""
-    def __init__(self, parent, variable=None, width=50, height=24, **kwargs):
+    _suppress = False  # Set during bulk updates; redraw afterwards with redraw_all()
+    _instances = weakref.WeakSet()
+
+    def __init__(self, parent, variable=None, width=50, height=24, command=None, **kwargs):
         super().__init__(parent, width=width, height=height, highlightthickness=0, **kwargs)
+        ModernToggleSwitch._instances.add(self)
         self.variable = variable or tk.BooleanVar()
+        self.command = command  # called with the new state after a user click only, not on variable.set()
         self.width = width
         self.height = height
 
@@ -942,6 +1262,11 @@ class ModernToggleSwitch(tk.Canvas):
         self.bg_off = "#555555"
         self.knob_color = "#FFFFFF"
 
+        # Canvas items are created once; update_display only reconfigures them
+        self._bg_id = self.create_rounded_rect(2, 2, self.width-2, self.height-2,
+                                               radius=self.height//2, fill=self.bg_off, outline="")
+        self._knob_id = self.create_oval(0, 0, 0, 0, fill=self.knob_color, outline="")
+
         self.bind("<Button-1>", self.toggle)
         self.variable.trace_add("write", self.update_display)
 
@@ -949,37 +1274,44 @@ class ModernToggleSwitch(tk.Canvas):
 
 
     def toggle(self, event=None):
-        self.variable.set(not self.variable.get())
+        value = not self.variable.get()
+        self.variable.set(value)
+        if self.command:
+            self.command(value)
+
+
+    @classmethod
+    def redraw_all(cls):
+        """Redraw every live switch, e.g. after a suppressed bulk update."""
+        for switch in list(cls._instances):
+            try:
+                switch.update_display()
+            except tk.TclError:
+                pass
 
 
     def update_display(self, *args):
-        self.delete("all")
+        if ModernToggleSwitch._suppress:
+            return
+        on = self.variable.get()
 
         # Background
-        bg_color = self.bg_on if self.variable.get() else self.bg_off
-        self.create_rounded_rect(2, 2, self.width-2, self.height-2, 
-                                radius=self.height//2, fill=bg_color, outline="")
+        self.itemconfigure(self._bg_id, fill=self.bg_on if on else self.bg_off)
 
         # Knob
-        knob_x = self.width - self.height//2 - 4 if self.variable.get() else self.height//2 + 2
+        knob_x = self.width - self.height//2 - 4 if on else self.height//2 + 2
         knob_radius = self.height//2 - 4
-        self.create_oval(knob_x-knob_radius, self.height//2-knob_radius,
-                        knob_x+knob_radius, self.height//2+knob_radius,
-                        fill=self.knob_color, outline="")
+        cy = self.height//2
+        self.coords(self._knob_id, knob_x-knob_radius, cy-knob_radius,
+                    knob_x+knob_radius, cy+knob_radius)
 
     def create_rounded_rect(self, x1, y1, x2, y2, radius=10, **kwargs):
-        points = []
-        for x, y in [(x1, y1+radius), (x1, y1), (x1+radius, y1),
-                     (x2-radius, y1), (x2, y1), (x2, y1+radius),
-                     (x2, y2-radius), (x2, y2), (x2-radius, y2),
-                     (x1+radius, y2), (x1, y2), (x1, y2-radius)]:
-            points.extend([x, y])
-        return self.create_polygon(points, smooth=True, **kwargs)
+        return self.create_polygon(_rounded_rect_points(x1, y1, x2, y2, radius), smooth=True, **kwargs)
 
 
 class ModernSectionFrame(tk.Frame):
     """Modern section frame with header and toggle"""
-    def __init__(self, parent, title="", toggle_var=None, **kwargs):
+    def __init__(self, parent, title="", toggle_var=None, toggle_command=None, **kwargs):
         super().__init__(parent, bg="#2a2a2a", **kwargs)
 
         # Header frame
@@ -994,7 +1326,8 @@ class ModernSectionFrame(tk.Frame):
 
         # Toggle switch
         if toggle_var:
-            self.toggle = ModernToggleSwitch(header_frame, toggle_var, bg="#2a2a2a")
+            self.toggle = ModernToggleSwitch(header_frame, toggle_var, bg="#2a2a2a",
+                                             command=toggle_command)
             self.toggle.pack(side=tk.RIGHT, pady=8)
 
         # Content frame
@@ -1009,6 +1342,7 @@ class ModernModuleButton(tk.Frame):
 
         self.active = active
         self.command = command
+        self._text = text  # last label text, so set_text can skip no-op updates
 
         # Colors
         self.active_color = "#4A90E2"
@@ -1050,6 +1384,8 @@ class ModernModuleButton(tk.Frame):
 
 
     def set_active(self, active):
+        if active == self.active:
+            return
         self.active = active
         color = self.active_color if active else self.inactive_color
         self.btn_frame.config(bg=color)
@@ -1058,25 +1394,77 @@ class ModernModuleButton(tk.Frame):
 
     def set_text(self, text):
         """Update the label text."""
+        if text == self._text:
+            return
+        self._text = text
         self.label.config(text=text)
 
 
 class LCDController:
+    _FRAME_INTERVAL = 0.04  # seconds between LCD frames (25 FPS)
+    _RESEND_INTERVAL = 1.0  # seconds an identical frame may go unsent
+    POLL_INTERVALS = (40, 200, 1000, 2000)  # _tick ms: active, idle <1s, idle <10s, parked
+
+    # Display formats for numeric metrics; anything else gets a generic "Name: value"
+    _METRIC_FORMATS = {
+        # Temperature metrics
+        "cpu_temp": "{:.0f}°C",
+        "gpu_temp": "{:.0f}°C",
+
+        # Frequency metrics
+        "cpu_freq": "{:.0f}MHz",
+        "gpu_clock": "{:4.0f}MHz",
+
+        # Percentage metrics
+        "cpu_percent": "{:.0f}%",
+        "gpu_usage": "{:.0f}%",
+        "mem_percent": "RAM {:.0f}%",
+        "disk_percent": "DISK {:.0f}%",
+
+        # Memory metrics
+        "mem_used_gb": "RAM {:.1f}GB",
+
+        # Disk metrics
+        "disk_free_gb": "DISK {:.0f}GB free",
+
+        # Fan metrics
+        "gpu_fan": "{:.0f}RPM",
+
+        # Count metrics
+        "cpu_count": "{:.0f} cores",
+    }
+
     def __init__(self, root, configfile):
         self.root = root
-        self._update_queue = queue.Queue(maxsize=1)  # only keep latest request
+        self._update_event = threading.Event()  # set when a redraw is wanted; repeated sets collapse
         self._stop_threads = threading.Event()  # Flag to stop threads
         self._paused = threading.Event()  # Flag to pause updates
         self._paused.set()  # Start unpaused
+        self._redraw_scheduled = False  # True while an idle redraw is pending
+        self._drag_redraw_pending = False  # True while a drag preview redraw is queued
+        self._bg_cache = None  # ((image_path, mtime), bytes) for the last static background
+        # Persistent frame the render worker draws into; USB and the preview get tobytes() snapshots
+        self._frame_img = Image.new("RGB", (320, 240))
+        self._frame_draw = ImageDraw.Draw(self._frame_img)
+        self._last_frame_key = None  # what the last drawn frame showed, if it can be reused
+        self._last_frame_bytes = None
+        # Workers are started by start_data_updates, once everything they read exists
         self._update_thread = threading.Thread(target=self._update_worker, daemon=True)
-        self._update_thread.start()
+        self._usb_cond = threading.Condition()
+        self._usb_frame = None  # latest rendered frame waiting for the USB thread
+        self._usb_thread = threading.Thread(target=self._usb_worker, daemon=True)
         self.draggable_items = {}
+        self._draggable_reversed = ()  # draggable_items in reverse, rebuilt by setup_draggable_elements
         self.background_image_id = None
         self.updating_gui = False
         self.active_module = None
+        self._about_box = None  # kept hidden between showings
         self.module_buttons = {}
         self.module_toggle_vars = {}
+        self.module_enabled = {}  # name -> enabled; the model behind module_toggle_vars, read without Tcl
+        self._enabled_children = 0  # number of True entries in module_enabled
         self.info_poller = lcd_driver.CSystemInfoPoller()
+        self.info_poller.start()  # polls on its own native thread; warm up during config load and UI build
         self.cached_metrics = {}
         self.configfile = configfile
         self.config_manager = lcd_driver.ConfigManager(self.configfile)
@@ -1084,7 +1472,7 @@ class LCDController:
         self.config_file = self.config_wrapper.get_config_file(self.configfile)
         self.config_wrapper.load_config(self.config_file)
         self.cached_config = self.config_wrapper.get_config()
-        self.last_metrics_update = datetime.now()
+        self.last_metrics_update = time.monotonic()
         self.metrics_update_interval = 1  # seconds (5 FPS)
         self.frame_times = deque(maxlen=60)
         self._frame_counter = 0
@@ -1093,19 +1481,29 @@ class LCDController:
         self.video_bg_path_var = ""
         self.image_bg_path_var = ""
         self.usb_ok = False
+        self._last_browse_dir = os.getcwd()  # initialdir for the next Browse
+
+        # Warm the directories the file browser is likely to open
+        base = get_resource_base()
+        threading.Thread(target=_prewarm_directories, daemon=True, args=([
+            self._last_browse_dir,
+            os.path.join(base, "USBLCD", "images"),
+            os.path.join(base, "USBLCD", "videos"),
+        ],)).start()
 
         self.bg_manager = lcd_driver.get_background_manager()
 
-        self._suppress_system_callback = False
-        self._suppress_child_callback = False
 
-        self.info_poller.start()
         self.setup_ui()
         self.setup_draggable_elements()
         self.start_data_updates()
 
     def show_about(self):
-        ThemedAboutBox(
+        box = self._about_box
+        if box is not None and box.winfo_exists():
+            box.present(self.root)
+            return
+        self._about_box = ThemedAboutBox(
             self.root,
             app_name="TR Driver",
             version=__version__,
@@ -1156,6 +1554,9 @@ class LCDController:
 
     def setup_styles(self):
         """Setup ttk styles for modern appearance"""
+        global _styles_configured
+        if _styles_configured:
+            return
         style = ttk.Style()
 
         # Configure progress bar style
@@ -1166,6 +1567,7 @@ class LCDController:
                        borderwidth=0,
                        lightcolor='#4CAF50',
                        darkcolor='#4CAF50')
+        _styles_configured = True
 
 
     def setup_display_panel(self, parent):
@@ -1215,28 +1617,22 @@ class LCDController:
         button_grid.pack(padx=15, pady=(0, 15))
         
         config = self.config_wrapper.get_config()
-        defaults = {
-            "M1": "cpu_temp", "M2": "cpu_percent", "M3": "cpu_freq",
-            "M4": "gpu_temp", "M5": "gpu_usage", "M6": "gpu_clock"
-        }
 
-        for i in range(1, 7):
-            name = f"M{i}"
-            metric = config.get(name, {}).get("metric", defaults[name])
+        for i, (name, default_metric) in enumerate(_MODULE_DEFAULTS):
+            metric = config.get(name, {}).get("metric", default_metric)
 
-            row = (i - 1) // 3
-            col = (i - 1) % 3
+            row, col = divmod(i, 3)
 
             btn = ModernModuleButton(button_grid, text=f"{name}\n{metric}",
-                                   command=lambda n=name: self.set_active_module(n))
+                                   command=functools.partial(self.set_active_module, name))
             btn.grid(row=row, column=col, padx=2, pady=2, sticky="nsew")
 
-            # Configure grid weights
-            button_grid.grid_rowconfigure(row, weight=1)
-            button_grid.grid_columnconfigure(col, weight=1)
-
             self.module_buttons[name] = btn
 
+        # Configure grid weights once for the 2x3 layout
+        button_grid.grid_rowconfigure((0, 1), weight=1)
+        button_grid.grid_columnconfigure((0, 1, 2), weight=1)
+
 
     def refresh_module_buttons(self):
         """Update module button labels and states based on current config"""
@@ -1252,23 +1648,20 @@ class LCDController:
 
 
     def refresh_system_toggles(self):
-        """Update toggle states and module UI from current config without triggering traces."""
+        """Update toggle states and module UI from current config."""
         config = self.config_wrapper.get_config()
 
-        # Ensure suppression flags exist
-        self._suppress_child_callback = getattr(self, "_suppress_child_callback", False)
-        self._suppress_system_callback = getattr(self, "_suppress_system_callback", False)
-
-        # Suppress child callbacks while we bulk set variables so we don't write back into config
-        self._suppress_child_callback = True
-        self._suppress_system_callback = True
+        # Switch redraws are suppressed during the bulk set and done once at the end.
+        # System info toggles report user clicks through their command, so var.set() here
+        # doesn't write back into config.
+        ModernToggleSwitch._suppress = True
         try:
             # Update all toggle BooleanVars tracked in module_toggle_vars
             for name, var in self.module_toggle_vars.items():
                 conf = config.get(name, {})
                 enabled = conf.get("enabled", True)
-                # Set the var - trace handler will not run because we're suppressing
                 var.set(bool(enabled))
+                self._note_toggle_state(name, bool(enabled))
 
                 # Also update any corresponding module button appearance
                 btn = self.module_buttons.get(name)
@@ -1285,21 +1678,14 @@ class LCDController:
                     except Exception:
                         pass
 
-
+            # Recompute master toggle: set master to True if any child is True.
+            if hasattr(self, "system_toggle"):
+                self.system_toggle.set(self._enabled_children > 0)
         finally:
-            # Turn suppression off so normal user interactions work again
-            self._suppress_child_callback = False
-            self._suppress_system_callback = False
-
-        # Recompute master toggle: set master to True if any child is True.
-        if hasattr(self, "system_toggle"):
-            new_master = any(v.get() for v in self.module_toggle_vars.values())
-            # Avoid triggering the master callback while setting it
-            self._suppress_system_callback = True
-            try:
-                self.system_toggle.set(new_master)
-            finally:
-                self._suppress_system_callback = False
+            ModernToggleSwitch._suppress = False
+
+        # Switch redraws were suppressed above; draw each one once now
+        ModernToggleSwitch.redraw_all()
     
         if hasattr(self, "update_datetime_controls"):
             try:
@@ -1308,7 +1694,7 @@ class LCDController:
                 pass
     
         # Finally request a redraw
-        self.update_display_immediately()
+        self.schedule_redraw()
 
 
     def reset_config(self):
@@ -1322,16 +1708,22 @@ class LCDController:
             self.setup_draggable_elements()  # Refresh display
             self.clear_image_background()
             self.clear_video_background()
-            self.update_display_immediately()
+            self.schedule_redraw()
 
 
-    def _centre_window(self, window, parent=None):
-        """Centre a window on its parent or screen"""
-        window.update_idletasks()
+    def _centre_window(self, window, parent=None, size=None):
+        """Centre a window on its parent or screen
+
+        If size (width, height) is given it is used as-is, skipping the forced layout pass.
+        """
+        if size:
+            window_width, window_height = size
+        else:
+            window.update_idletasks()
 
-        # Get window dimensions
-        window_width = window.winfo_width()
-        window_height = window.winfo_height()
+            # Get window dimensions
+            window_width = window.winfo_width()
+            window_height = window.winfo_height()
 
         # If parent exists, centre on parent
         if parent:
@@ -1350,7 +1742,10 @@ class LCDController:
             x = (screen_width - window_width) // 2
             y = (screen_height - window_height) // 2
 
-        window.geometry(f"+{x}+{y}")
+        if size:
+            window.geometry(f"{window_width}x{window_height}+{x}+{y}")
+        else:
+            window.geometry(f"+{x}+{y}")
 
 
     def setup_primary_control_panel(self, parent):
@@ -1405,15 +1800,18 @@ class LCDController:
         loading_label = tk.Label(secondary_panel, text="Loading thumbnails...", 
                                 bg="#2b2b2b", fg="white", font=("Arial", 12))
         loading_label.pack(expand=True)
-        secondary_panel.update()
 
-        # Background section
-        self.setup_background_modern(secondary_panel)
+        def build_background_section():
+            # Background section
+            self.setup_background_modern(secondary_panel)
+
+            # Add some spacing
+            spacer = tk.Frame(secondary_panel, bg="#1e1e1e", height=20)
+            spacer.pack(fill=tk.X)
+            loading_label.destroy()
 
-        # Add some spacing
-        spacer = tk.Frame(secondary_panel, bg="#1e1e1e", height=20)
-        spacer.pack(fill=tk.X)
-        loading_label.destroy()
+        # Let the main window paint first; thumbnails are built once the event loop is idle
+        self.root.after_idle(build_background_section)
 
 
     def setup_custom_text_modern(self, parent):
@@ -1466,8 +1864,10 @@ class LCDController:
 
         # Simple toggle handler like date/time
         def on_custom_toggle():
-            self.config_manager.update_config_value("custom.enabled", self.toggle_custom.get())
-            self.update_display_immediately()
+            enabled = self.toggle_custom.get()
+            self.config_manager.update_config_value("custom.enabled", enabled)
+            self._note_toggle_state("custom", enabled)
+            self.schedule_redraw()
 
         self.custom_text_var.trace_add("write", on_custom_text_change)
         self.toggle_custom.trace_add("write", lambda *args: on_custom_toggle())
@@ -1530,17 +1930,22 @@ class LCDController:
 
         # --- Bind events ---
         def on_time_toggle(*args):
-            self.config_manager.update_config_value("time.enabled", self.time_toggle.get())
-            self.update_display_immediately()
+            enabled = self.time_toggle.get()
+            self.config_manager.update_config_value("time.enabled", enabled)
+            self._note_toggle_state("time", enabled)
+            self.schedule_redraw()
 
         def on_date_toggle(*args):
-            self.config_manager.update_config_value("date.enabled", self.date_toggle.get())
-            self.update_display_immediately()
+            enabled = self.date_toggle.get()
+            self.config_manager.update_config_value("date.enabled", enabled)
+            self._note_toggle_state("date", enabled)
+            self.schedule_redraw()
 
         self.time_toggle.trace_add("write", on_time_toggle)
         self.module_toggle_vars["time"] = self.time_toggle
         self.module_toggle_vars["date"] = self.date_toggle
         self.date_toggle.trace_add("write", on_date_toggle)
+        self._date_fmt_job = None
         self.date_format_var.trace_add("write", self.on_date_format_change)
 
         self.update_date_preview()
@@ -1552,7 +1957,8 @@ class LCDController:
 
         # Master toggle
         self.system_toggle = tk.BooleanVar(value=True)
-        section = ModernSectionFrame(parent, "System Info", self.system_toggle)
+        section = ModernSectionFrame(parent, "System Info", self.system_toggle,
+                                     toggle_command=lambda value: on_system_toggle(value))
         section.pack(fill=tk.X, pady=(0, 15))
 
         # Track toggle vars
@@ -1569,41 +1975,31 @@ class LCDController:
                              bg="#2a2a2a", font=("Arial", 10))
             label.pack(side="left", padx=(0, 5))
     
-            toggle = ModernToggleSwitch(frame, var, bg="#2a2a2a")
+            # Clicks update config + preview immediately; programmatic var.set() doesn't
+            toggle = ModernToggleSwitch(frame, var, bg="#2a2a2a",
+                                        command=lambda value, n=tag: on_child_toggle(n, value))
             toggle.pack(side="left", padx=(0, 15), pady=5)
 
-            # Bind: update config + preview immediately
-            var.trace_add("write", lambda *args, n=tag: on_child_toggle(n))
-
         # --- Handlers ---
-        def on_system_toggle(*args):
+        def on_system_toggle(enabled):
             """Flip all children when master toggled by user"""
-            if getattr(self, "_suppress_system_callback", False):
-                return
-            enabled = self.system_toggle.get()
-            self._suppress_child_callback = True
-            try:
-                for name, var in self.module_toggle_vars.items():
-                    var.set(enabled)
-                    self.on_module_toggle(name)
-            finally:
-                self._suppress_child_callback = False
-            self.update_display_immediately()
-
-        def on_child_toggle(name, *args):
+            for var in self.module_toggle_vars.values():
+                var.set(enabled)
+            # One config write for every child instead of one per toggle
+            self.config_manager.update_config_values(
+                {f"{name}.enabled": enabled for name in self.module_toggle_vars})
+            self.module_enabled = dict.fromkeys(self.module_toggle_vars, enabled)
+            self._enabled_children = len(self.module_enabled) if enabled else 0
+            self.schedule_redraw()
+
+        def on_child_toggle(name, enabled):
             """Child toggle changed → update config + recompute master"""
-            if getattr(self, "_suppress_child_callback", False):
-                return
-            self.on_module_toggle(name)
-            # Master ON if any child ON, OFF if all children OFF
-            new_master = any(v.get() for v in self.module_toggle_vars.values())
-            if new_master != self.system_toggle.get():
-                self._suppress_system_callback = True
-                try:
-                    self.system_toggle.set(new_master)
-                finally:
-                    self._suppress_system_callback = False
-            self.update_display_immediately()
+            # The master always shows whether any child is on
+            old_master = self._enabled_children > 0
+            self.set_module_enabled(name, enabled, sync_widget=False)
+            new_master = self._enabled_children > 0
+            if new_master != old_master:
+                self.system_toggle.set(new_master)
 
         # --- CPU row ---
         cpu_row = tk.Frame(section.content_frame, bg="#2a2a2a")
@@ -1619,21 +2015,14 @@ class LCDController:
         for i in range(4, 7):
             add_toggle(gpu_row, f"M{i}")
 
-        # Hook up master toggle
-        self.system_toggle.trace_add("write", on_system_toggle)
-
         # Sync master to initial child state
-        self._suppress_system_callback = True
-        try:
-            self.system_toggle.set(any(v.get() for v in self.module_toggle_vars.values()))
-        finally:
-            self._suppress_system_callback = False
+        for name, var in self.module_toggle_vars.items():
+            self._note_toggle_state(name, var.get())
+        self.system_toggle.set(self._enabled_children > 0)
 
 
     def setup_background_modern(self, parent):
         """Tabbed background selector (themes & videos)."""
-        from background_selector import BackgroundSelector
-
         selector = BackgroundSelector(
             parent,
             config_manager=self.config_manager,
@@ -1651,6 +2040,7 @@ class LCDController:
 
     def apply_theme_preview(self, image_path):
         """Apply a theme image immediately after selection."""
+        self._bg_cache = None
         self.config_manager.update_config_value("image_background_path", image_path)
         self.refresh_module_buttons()
         self.refresh_system_toggles()
@@ -1686,19 +2076,25 @@ class LCDController:
         self.config_manager.update_config_value("time.format", fmt)
         if "time" in self.draggable_items:
             if fmt == "24h":
-                time_text = datetime.now().strftime("%H:%M")
+                time_text = format_now("%H:%M")
             else:
-                time_text = datetime.now().strftime("%I:%M %p")
+                time_text = format_now("%I:%M %p")
             self.draggable_items["time"].update_text(time_text)
         self.update_display_immediately()
 
     def on_date_format_change(self, *args):
+        # Debounce keystrokes in the format entry
+        if self._date_fmt_job is not None:
+            self.root.after_cancel(self._date_fmt_job)
+        self._date_fmt_job = self.root.after(150, self._do_date_format_change)
+
+    def _do_date_format_change(self):
+        self._date_fmt_job = None
         fmt = self.date_format_var.get()
         self.config_manager.update_config_value("date.format", fmt)
         if "date" in self.draggable_items:
             try:
-                date_text = datetime.now().strftime(fmt)
-                date_text = date_text.replace('\\n', '\n')
+                date_text = format_now(fmt)
                 self.draggable_items["date"].update_text(date_text)
             except Exception:
                 self.draggable_items["date"].update_text("Invalid Format")
@@ -1708,16 +2104,27 @@ class LCDController:
     def update_date_preview(self):
         fmt = self.date_format_var.get()
         try:
-            preview_text = datetime.now().strftime(fmt)
-            preview_text = preview_text.replace('\\n','')
+            preview_text = format_now(fmt)
+            preview_text = preview_text.replace('\n','')
             self.date_preview.config(text=f"Preview: {preview_text}")
         except Exception:
             self.date_preview.config(text="Preview: Invalid format")
 
-    def on_module_toggle(self, name):
-        enabled = self.module_toggle_vars[name].get()
+    def _note_toggle_state(self, name, enabled):
+        """Record a toggle's state and keep the enabled count in step."""
+        prev = self.module_enabled.get(name, False)
+        if prev == enabled:
+            return
+        self.module_enabled[name] = enabled
+        self._enabled_children += 1 if enabled else -1
+
+    def set_module_enabled(self, name, enabled, sync_widget=True):
+        """Enable or disable an item: model, config, switch (unless it already shows it) and preview."""
+        self._note_toggle_state(name, enabled)
         self.config_manager.update_config_value(f"{name}.enabled", enabled)
-        self.update_display_immediately()
+        if sync_widget:
+            self.module_toggle_vars[name].set(enabled)
+        self.schedule_redraw()
 
     def browse_video_background(self):
         """Browse for video background file"""
@@ -1725,8 +2132,9 @@ class LCDController:
             ("Video files", "*.mp4 *.avi *.mov *.mkv"),
             ("All files", "*.*")
         )
-        filename = askopenfilename(parent=self.root, title="Select Video Background", filetypes=filetypes, initialdir=os.getcwd())
+        filename = askopenfilename(parent=self.root, title="Select Video Background", filetypes=filetypes, initialdir=self._last_browse_dir)
         if filename:
+            self._last_browse_dir = os.path.dirname(filename)
             self.video_bg_path_var=filename
             self.config_manager.update_config_value("video_background_path", filename)
             self.update_display_immediately()
@@ -1744,9 +2152,11 @@ class LCDController:
             ("Image files", "*.png *.jpg *.jpeg *.bmp *.gif"),
             ("All files", "*.*")
         )
-        filename = askopenfilename(parent=self.root,title="Select Image Background", filetypes=filetypes, initialdir=os.getcwd())
+        filename = askopenfilename(parent=self.root,title="Select Image Background", filetypes=filetypes, initialdir=self._last_browse_dir)
         if filename:
+            self._last_browse_dir = os.path.dirname(filename)
             self.image_bg_path_var=filename
+            self._bg_cache = None
             directory = os.path.dirname(filename)
             local_config_file = os.path.join(directory, "lcd_config.json")
     
@@ -1799,7 +2209,7 @@ class LCDController:
             config = self.config_wrapper.get_config()
             self.config_manager.update_config_value(f"{module_name}.metric", selection)
             # Update button label
-            self.module_buttons[module_name].label.config(text=f"{module_name}: {selection}")
+            self.module_buttons[module_name].set_text(f"{module_name}: {selection}")
             self.update_display_immediately()
             popup.destroy()
 
@@ -1824,36 +2234,43 @@ class LCDController:
 
         self.draggable_items.clear()
 
+        # Open every font the profile uses before building items
+        DraggableTextPillow.preload_fonts(
+            conf.get("font", DEFAULT_FONT_CONFIG) for conf in config.values() if isinstance(conf, dict)
+        )
+
         for tag, conf in config.items():
             if not isinstance(conf, dict):
                 continue  # Skip settings like background_path
 
             x, y = conf.get("x", 10), conf.get("y", 10)
-            font_config = conf.get("font", {"family": "DejaVu Sans", "size": 20, "style": "normal"})
+            font_config = conf.get("font", dict(DEFAULT_FONT_CONFIG))
             color = conf.get("color", "#FFFFFF")
 
             if tag == "time":
                 time_format = conf.get("format", "24h")
                 if time_format == "24h":
-                    text = datetime.now().strftime("%H:%M")
+                    text = format_now("%H:%M")
                 else:
-                    text = datetime.now().strftime("%I:%M %p")
+                    text = format_now("%I:%M %p")
             elif tag == "date":
                 date_format = conf.get("format", "%d-%m-%Y")  # This should use saved format
                 try:
-                    text = datetime.now().strftime(date_format)
-                    text = text.replace('\\n', '\n')
+                    text = format_now(date_format)
                 except Exception:
-                    text = datetime.now().strftime("%d-%m-%Y")
+                    text = format_now("%d-%m-%Y")
 
             if tag.startswith("M"):
-                text = self.get_display_text_for_metric(conf.get("metric", "cpu_temp"), {})
+                text = self.get_display_text_for_metric(conf.get("metric", "cpu_temp"), {}, config)
             elif tag in ("cpu_label", "gpu_label", "custom"):
                 text = conf.get("text", tag)
 
             self.draggable_items[tag] = DraggableTextPillow(
-                tag, text, x, y, font_config, color, self.render_lcd_image
+                tag, text, x, y, font_config, color, self.update_display_immediately
             )
+
+        # Topmost-first order for hit testing; only changes when the items are rebuilt
+        self._draggable_reversed = tuple(reversed(self.draggable_items.items()))
             
     def safe_number(self, val, default=0):
         try:
@@ -1861,90 +2278,54 @@ class LCDController:
         except Exception:
             return default
 
-    def get_display_text_for_metric(self, metric, info):
-        # Check if we're using a vendor image that already includes labels/units
-        bg_path = self.config_wrapper.get_config().get("image_background_path") or ""
-        skip_formatting = any(tag in bg_path for tag in ["/002", "/vendor/"]) if bg_path else False
+    def get_display_text_for_metric(self, metric, info, config=None):
+        if config is None:
+            config = self.cached_config
 
         # Handle special cases first (non-numeric or special formatting)
         if metric == "time":
-            return datetime.now().strftime("%H:%M")
+            return format_now("%H:%M")
         elif metric == "date":
-            return datetime.now().strftime("%d-%m-%Y")
+            return format_now("%d-%m-%Y")
         elif metric == "custom":
-            return self.config_wrapper.get_config().get("custom_text", "Hello")
+            return config.get("custom_text", "Hello")
 
         # Handle all numeric metrics with appropriate units and formatting
         value = self.safe_number(info.get(metric, 0))
 
         # If vendor image has text already, just return plain numbers
-        if skip_formatting:
+        if _is_vendor_background(config.get("image_background_path") or ""):
             return f"{value:.0f}"
 
-        # Define formatting rules for different metric types
-        metric_formats = {
-            # Temperature metrics
-            "cpu_temp": f"{value:.0f}°C",
-            "gpu_temp": f"{value:.0f}°C",
-
-            # Frequency metrics  
-            "cpu_freq": f"{value:.0f}MHz",
-            "gpu_clock": f"{value:4.0f}MHz",
-
-            # Percentage metrics
-            "cpu_percent": f"{value:.0f}%",
-            "gpu_usage": f"{value:.0f}%",
-            "mem_percent": f"RAM {value:.0f}%",
-            "disk_percent": f"DISK {value:.0f}%",
-
-            # Memory metrics
-            "mem_used_gb": f"RAM {value:.1f}GB",
-
-            # Disk metrics
-            "disk_free_gb": f"DISK {value:.0f}GB free",
-
-            # Fan metrics
-            "gpu_fan": f"{value:.0f}RPM",
-
-            # Count metrics
-            "cpu_count": f"{value:.0f} cores",
-
-        }
-
         # Return formatted value if we have a rule, otherwise generic format
-        return metric_formats.get(metric, f"{metric.replace('_', ' ').title()}: {value:.1f}")
+        spec = self._METRIC_FORMATS.get(metric)
+        if spec is None:
+            return f"{metric.replace('_', ' ').title()}: {value:.1f}"
+        return spec.format(value)
 
     def sync_items_to_config(self):
         config = self.config_wrapper.get_config()
+        updates = {}
         for tag, item in self.draggable_items.items():
-            current_enabled = config.get(tag, {}).get("enabled", True)
-            self.config_manager.update_config_value(f"{tag}.x", item.x)
-            self.config_manager.update_config_value(f"{tag}.y", item.y)
-            self.config_manager.update_config_value(f"{tag}.font", item.font_config)
-            self.config_manager.update_config_value(f"{tag}.color", item.color)
-            self.config_manager.update_config_value(f"{tag}.enabled", current_enabled)
-            if tag in ("cpu_label", "gpu_label", "custom"):
-                self.config_manager.update_config_value(f"{tag}.text", item.text)
-            conf = config.setdefault(tag, {})
-            conf.update({
-                "x": item.x,
-                "y": item.y,
-                "font": item.font_config,
-                "color": item.color,
-                "enabled": True,
-            })
+            updates[f"{tag}.x"] = item.x
+            updates[f"{tag}.y"] = item.y
+            updates[f"{tag}.font"] = item.font_config
+            updates[f"{tag}.color"] = item.color
+            updates[f"{tag}.enabled"] = config.get(tag, {}).get("enabled", True)
             if tag in ("cpu_label", "gpu_label", "custom"):
-                conf["text"] = item.text
+                updates[f"{tag}.text"] = item.text
 
-        # At this point _config is fully up to date in memory
+        # One call into the driver instead of one per field
+        self.config_manager.update_config_values(updates)
 
     def on_canvas_press(self, event):
         self.dragging_item = None
         config = self.config_wrapper.get_config()
 
         # Only check visible items
-        for tag, item in reversed(list(self.draggable_items.items())):
-            if self.is_item_visible(tag, config) and item.contains(event.x, event.y):
+        visible = self.visible_tags(config)
+        for tag, item in self._draggable_reversed:
+            if tag in visible and item.contains(event.x, event.y):
                 self.dragging_item = item
                 self.drag_start_x = event.x
                 self.drag_start_y = event.y
@@ -1961,8 +2342,14 @@ class LCDController:
             self.drag_start_x = event.x
             self.drag_start_y = event.y
 
-            # Only update the canvas preview, not the LCD device
-            self.update_canvas_preview_only()
+            # Only update the canvas preview, not the LCD device; at most one per ~16 ms
+            if not self._drag_redraw_pending:
+                self._drag_redraw_pending = True
+                self.root.after(16, self._do_drag_redraw)
+
+    def _do_drag_redraw(self):
+        self._drag_redraw_pending = False
+        self.update_canvas_preview_only()
 
     def on_canvas_release(self, event):
         if getattr(self, 'dragging_item', None):
@@ -1983,19 +2370,13 @@ class LCDController:
         try:
             config = self.config_wrapper.get_config()
 
-            bg_video_path = self.config_wrapper.get_config().get("video_background_path") or ""
-            bg_image_path = self.config_wrapper.get_config().get("image_background_path") or ""
-
-            bg_img = self.bg_manager.get_background_bytes(bg_video_path, bg_image_path)
-            if bg_img is not None:
-                img = Image.frombytes("RGB", (320, 240), bg_img)
-            else:
-                img = Image.new("RGB", (320, 240), "black")
+            img = self.render_background(config)
             draw = ImageDraw.Draw(img)
 
             # Draw all visible items
+            visible = self.visible_tags(config)
             for tag, item in self.draggable_items.items():
-                if self.is_item_visible(tag, config):
+                if tag in visible:
                     item.draw(draw)
 
             # Update only the canvas display, skip USB
@@ -2007,12 +2388,17 @@ class LCDController:
 
     def on_canvas_double_click(self, event):
         config = self.config_wrapper.get_config()
-        
-        for tag, item in reversed(list(self.draggable_items.items())):
-            if self.is_item_visible(tag, config) and item.contains(event.x, event.y):
+        visible = self.visible_tags(config)
+
+        for tag, item in self._draggable_reversed:
+            if tag in visible and item.contains(event.x, event.y):
                 item.open_style_editor(self.root)
                 break
 
+    def visible_tags(self, config):
+        """Return the set of draggable item tags enabled in config"""
+        return {tag for tag in self.draggable_items if config.get(tag, _NO_CONF).get("enabled", True)}
+
     def is_item_visible(self, tag, config=None):
         """Check if an item should be visible based on config"""
         if config is None:
@@ -2020,13 +2406,46 @@ class LCDController:
 
         return config.get(tag, {}).get("enabled", True)
 
-    def render_background(self):
-        """Fetch and return just the background image (PIL.Image)."""
-        bg_video_path = self.config_wrapper.get_config().get("video_background_path") or ""
-        bg_image_path = self.config_wrapper.get_config().get("image_background_path") or ""
+    def _background_bytes(self, config):
+        """Return the raw RGB bytes of the current background (empty if there is none)."""
+        bg_video_path = config.get("video_background_path") or ""
+        bg_image_path = config.get("image_background_path") or ""
+
+        if bg_video_path:
+            bg_img = self.bg_manager.get_background_bytes(bg_video_path, bg_image_path)
+        else:
+            # Without a video the background only changes with the image file; the mtime
+            # picks up a file edited or replaced in place, as the driver's own cache does
+            try:
+                mtime = os.path.getmtime(bg_image_path) if bg_image_path else None
+            except OSError:
+                mtime = None
+            key = (bg_image_path, mtime)
+            cached = self._bg_cache
+            if cached is None or cached[0] != key:
+                cached = (key, self.bg_manager.get_background_bytes("", bg_image_path))
+                self._bg_cache = cached
+            bg_img = cached[1]
+        return bg_img
+
+    def render_background(self, config=None, target=None, bg_img=None):
+        """Fetch and return just the background image (PIL.Image).
+
+        If target (a 320x240 RGB image) is given, the background is written into it in place.
+        bg_img may pass in background bytes the caller has already fetched.
+        """
+        if config is None:
+            config = self.config_wrapper.get_config()
+        if bg_img is None:
+            bg_img = self._background_bytes(config)
+
+        if target is not None:
+            if bg_img:
+                target.frombytes(bg_img)
+            else:
+                target.paste((0, 0, 0), (0, 0, 320, 240))
+            return target
 
-        bg_img = self.bg_manager.get_background_bytes(bg_video_path, bg_image_path)
-    
         if bg_img:
             img = Image.frombytes("RGB", (320, 240), bg_img)
         else:
@@ -2041,130 +2460,183 @@ class LCDController:
 
         config = self.config_wrapper.get_config()
         info = self.info_poller.get_info()
-        now = datetime.now()
 
         text_updates = {}
 
         # --- Time ---
-        time_conf = config.get("time", {})
+        time_conf = config.get("time", _NO_CONF)
         if time_conf.get("enabled", True):
             tf = time_conf.get("format", "24h")
             if tf == "24h":
-                text_updates["time"] = now.strftime("%H:%M")
+                text_updates["time"] = format_now("%H:%M")
             else:
-                text_updates["time"] = now.strftime("%I:%M %p")
+                text_updates["time"] = format_now("%I:%M %p")
 
         # --- Date ---
-        date_conf = config.get("date", {})
+        date_conf = config.get("date", _NO_CONF)
         if date_conf.get("enabled", True):
             fmt = date_conf.get("format", "%d-%m-%Y")
             try:
-                text_updates["date"] = now.strftime(fmt)
-                text_updates["date"] = text_updates["date"].replace('\\n', '\n')
+                text_updates["date"] = format_now(fmt)
             except Exception:
-                text_updates["date"] = now.strftime("%d-%m-%Y")
+                text_updates["date"] = format_now("%d-%m-%Y")
 
         # --- Custom text (now same pattern as date/time) ---
-        custom_conf = config.get("custom", {})
+        custom_conf = config.get("custom", _NO_CONF)
         if custom_conf.get("enabled", True):  # Same default as others
             text_updates["custom"] = custom_conf.get("text", "LINUX")
 
         # --- CPU/GPU labels ---
         for lbl in ("cpu_label", "gpu_label"):
-            conf = config.get(lbl, {})
+            conf = config.get(lbl, _NO_CONF)
             if conf.get("enabled", True):
                 text_updates[lbl] = conf.get("text", lbl.upper())
 
         # --- Modules ---
-        for module_name, module_conf in ((k, v) for k, v in config.items() if k.startswith("M")):
-            if not module_conf.get("enabled", True):
+        for module_name in _MODULE_NAMES:
+            module_conf = config.get(module_name)
+            if module_conf is None or not module_conf.get("enabled", True):
                 continue
             metric = module_conf.get("metric", "")
-            text = self.get_display_text_for_metric(metric, info)
+            text = self.get_display_text_for_metric(metric, info, config)
             text_updates[module_name] = text
 
         # Push updates to draggable items
         for tag, text in text_updates.items():
-            if tag in self.draggable_items and text is not None:
-                self.draggable_items[tag].update_text(text, trigger_callback=False)
+            item = self.draggable_items.get(tag)
+            if item is not None and text is not None and item.text != text:
+                item.update_text(text, trigger_callback=False)
 
         # Draw all items
+        visible = self.visible_tags(config)
         for tag, item in self.draggable_items.items():
-            if self.is_item_visible(tag, config):
+            if tag in visible:
                 item.draw(draw)
 
         return img
 
     def render_lcd_image(self):
         """Build and send image to device (heavy, no Tkinter)."""
-        img = self.render_background()  # always fetch current video frame
-        config = self.cached_config
+        # One config snapshot per frame (get_config copies the whole config out of the driver)
+        config = self.config_wrapper.get_config()
+        self.cached_config = config
 
         # --- metrics caching ---
-        now = datetime.now()
-        elapsed = (now - self.last_metrics_update).total_seconds()
-        if elapsed >= self.metrics_update_interval:
+        tick = time.monotonic()
+        if tick - self.last_metrics_update >= self.metrics_update_interval:
             info = self.info_poller.get_info()
-            self.cached_config = self.config_wrapper.get_config()
-            config = self.cached_config
-            text_updates = {}
+            # Rebuild the metrics dict in place rather than allocating a new one each tick
+            text_updates = self.cached_metrics
+            text_updates.clear()
 
             # --- Time ---
-            time_conf = config.get("time", {})
+            time_conf = config.get("time", _NO_CONF)
             if time_conf.get("enabled", True):
                 tf = time_conf.get("format", "24h")
-                text_updates["time"] = now.strftime("%H:%M") if tf=="24h" else now.strftime("%I:%M %p")
+                text_updates["time"] = format_now("%H:%M" if tf == "24h" else "%I:%M %p")
 
             # --- Date ---
-            date_conf = config.get("date", {})
+            date_conf = config.get("date", _NO_CONF)
             if date_conf.get("enabled", True):
                 fmt = date_conf.get("format", "%d-%m-%Y")
                 try:
-                    text_updates["date"] = now.strftime(fmt)
-                    text_updates["date"] = text_updates["date"].replace('\\n', '\n')
+                    text_updates["date"] = format_now(fmt)
                 except Exception:
-                    text_updates["date"] = now.strftime("%d-%m-%Y")
+                    text_updates["date"] = format_now("%d-%m-%Y")
 
             # --- Custom text ---
-            custom_conf = config.get("custom", {})
+            custom_conf = config.get("custom", _NO_CONF)
             if custom_conf.get("enabled", True):
                 text_updates["custom"] = custom_conf.get("text", "")
 
             # --- CPU/GPU labels ---
             for lbl in ("cpu_label", "gpu_label"):
-                conf = config.get(lbl, {})
+                conf = config.get(lbl, _NO_CONF)
                 if conf.get("enabled", True):
                     text_updates[lbl] = conf.get("text", lbl.upper())
 
             # --- Modules ---
-            for module_name, module_conf in ((k, v) for k, v in config.items() if k.startswith("M")):
-                if module_conf.get("enabled", True):
+            for module_name in _MODULE_NAMES:
+                module_conf = config.get(module_name)
+                if module_conf is not None and module_conf.get("enabled", True):
                     metric = module_conf.get("metric", "")
-                    text_updates[module_name] = self.get_display_text_for_metric(metric, info)
+                    text_updates[module_name] = self.get_display_text_for_metric(metric, info, config)
 
-            self.cached_metrics = text_updates
-            self.last_metrics_update = now
+            self.last_metrics_update = tick
 
         # Draw cached metrics
-        draw = ImageDraw.Draw(img)
         # Push updates to draggable items
         for tag, text in self.cached_metrics.items():
-            if tag in self.draggable_items and text is not None:
-                self.draggable_items[tag].update_text(text, trigger_callback=False)
+            item = self.draggable_items.get(tag)
+            if item is not None and text is not None and item.text != text:
+                item.update_text(text, trigger_callback=False)
+
+        visible = self.visible_tags(config)
+        items = self.draggable_items
+
+        # The frame is fully determined by the background and the visible items; if none of
+        # that changed, send the last frame again as is. A static background is the same
+        # cached bytes object every time, and a video frame that hasn't advanced compares
+        # equal with a single memcmp, so this also covers videos slower than our frame rate.
+        bg_img = self._background_bytes(config)
+        frame_key = (
+            bg_img,
+            tuple((tag, item.text, item.x, item.y, item.color, item._get_font())
+                  for tag, item in items.items() if tag in visible),
+        )
+        if frame_key == self._last_frame_key:
+            with self._usb_cond:
+                self._usb_frame = self._last_frame_bytes
+                self._usb_cond.notify()
+            return
 
-        for tag, item in self.draggable_items.items():
-            if self.is_item_visible(tag, config):
+        img = self.render_background(config, self._frame_img, bg_img)
+        draw = self._frame_draw
+
+        for tag, item in items.items():
+            if tag in visible:
                 item.draw(draw)
-        try:
-            self.usb_ok = lcd_driver.update_lcd_image(img.tobytes())
-            if not self.usb_ok:
-                # Pause all updates
-                self._paused.clear()
-                # Show blocking messagebox in main thread
-                self.root.after(0, self._show_usb_error_and_wait)
-        except:
-            exit(1)
-        return img
+
+        # Hand the frame to the USB thread; a frame it hasn't picked up yet is replaced.
+        # tobytes() stays: Pillow can't back an RGB image with a caller-owned buffer
+        # (frombuffer only shares memory for 1/4-byte modes, and drawing un-shares it),
+        # and the USB thread needs its own snapshot while the next frame is drawn anyway.
+        frame = img.tobytes()
+        self._last_frame_key = frame_key
+        self._last_frame_bytes = frame
+        with self._usb_cond:
+            self._usb_frame = frame
+            self._usb_cond.notify()
+
+    def _usb_worker(self):
+        """Send rendered frames to the LCD while the next frame is being drawn."""
+        last_sent = None
+        last_sent_at = 0.0
+        while not self._stop_threads.is_set():
+            with self._usb_cond:
+                while self._usb_frame is None and not self._stop_threads.is_set():
+                    self._usb_cond.wait(timeout=0.1)
+                frame, self._usb_frame = self._usb_frame, None
+            if self._stop_threads.is_set():
+                break
+
+            # Drop frames rendered just before a failure paused updates
+            if frame is None or not self._paused.is_set():
+                continue
+            # An unchanged frame only needs resending now and then to keep the panel fed
+            now = time.monotonic()
+            if frame == last_sent and now - last_sent_at < self._RESEND_INTERVAL:
+                continue
+            try:
+                self.usb_ok = lcd_driver.update_lcd_image(frame)
+                last_sent, last_sent_at = (frame, now) if self.usb_ok else (None, 0.0)
+                if not self.usb_ok:
+                    # Pause all updates
+                    self._paused.clear()
+                    # Show blocking messagebox in main thread
+                    self.root.after(0, self._show_usb_error_and_wait)
+            except:
+                exit(1)
     
     def _show_usb_error_and_wait(self):
         """Show error dialog and wait for user to click OK"""
@@ -2181,6 +2653,7 @@ class LCDController:
             exit(1)
         # Resume updates after OK is clicked
         self._paused.set()
+        self.resume_gui_polling()
         # Trigger immediate update
         self.update_display_immediately()
 
@@ -2193,38 +2666,67 @@ class LCDController:
 
     def update_display_immediately(self):
         """Request a display update in the background thread."""
-        try:
-            # drop old request if queue is full
-            if self._update_queue.full():
-                self._update_queue.get_nowait()
-            self._update_queue.put_nowait(True)
-        except queue.Full:
-            pass
+        self._update_event.set()
+
+
+    def schedule_redraw(self):
+        """Coalesce redraw requests made in the same Tk tick into one update."""
+        if self._redraw_scheduled:
+            return
+        self._redraw_scheduled = True
+        self.root.after_idle(self._do_redraw)
+
+
+    def _do_redraw(self):
+        self._redraw_scheduled = False
+        self.update_display_immediately()
 
 
     def _update_worker(self):
+        next_frame = time.monotonic()
+        previewed = None  # frame bytes last handed to draw_preview
         while not self._stop_threads.is_set():
             try:
-                # Wait for update request with timeout to check stop flag
-                try:
-                    self._update_queue.get(timeout=0.1)
-                except queue.Empty:
-                    continue
+                # Sleep until the next frame is due; an update request wakes us early
+                self._update_event.wait(timeout=max(0.0, next_frame - time.monotonic()))
+                self._update_event.clear()
+                if self._stop_threads.is_set():
+                    break
                 
-                # Wait if paused
-                if not self._paused.wait(timeout=0.1):
+                # Block while paused; cleanup sets the flag so we can exit
+                if not self._paused.is_set():
+                    self._paused.wait()
+                    next_frame = time.monotonic()
+                    continue
+
+                if self.updating_gui:
+                    next_frame = time.monotonic() + self._FRAME_INTERVAL
+                    continue
+
+                # The USB thread hasn't picked up the last frame yet, so the panel is
+                # slower than our frame rate; rendering now would only overwrite it
+                if self._usb_frame is not None and self.usb_ok:
+                    next_frame = time.monotonic() + self._FRAME_INTERVAL
                     continue
-                    
+
                 start = time.perf_counter()
+                next_frame = time.monotonic() + self._FRAME_INTERVAL
 
-                img = self.render_lcd_image()  # heavy (PIL + USB)
+                self.render_lcd_image()  # heavy (PIL + USB)
 
                 # Only schedule the Tk preview update if GUI should be updating
                 try:
                     should_update = getattr(self, "gui_should_update", True)
 
-                    if getattr(self, "root", None) is not None and should_update:
-                        self.root.after(0, lambda i=img: self.draw_preview(i))  # GUI-safe
+                    # Preview from the immutable bytes sent to USB, not the persistent frame
+                    # image the worker redraws two frames later; skip it when the frame was
+                    # reused and that exact frame is already on the canvas
+                    frame = self._last_frame_bytes
+                    if (getattr(self, "root", None) is not None and should_update
+                            and frame is not None and frame is not previewed):
+                        previewed = frame
+                        self.root.after(0, lambda f=frame: self.draw_preview(
+                            Image.frombytes("RGB", (320, 240), f)))  # GUI-safe
                     # else: window not focused/minimized, skip GUI update to save resources
                 except Exception as e:
                     # If something odd happens, still avoid crashing the worker
@@ -2234,8 +2736,9 @@ class LCDController:
                 self._frame_counter += 1
 
             except Exception:
-                import traceback
                 traceback.print_exc()
+                # Don't retry against a deadline that has already passed
+                next_frame = time.monotonic() + self._FRAME_INTERVAL
 
     def get_resource_base(self):
         """Get the base directory where USBLCD is located"""
@@ -2307,101 +2810,138 @@ class LCDController:
         self.is_minimized = False
         self.has_focus = True   
         self.is_mapped = True
-        self._lcd_timer_id = None  # Track timer ID for cancellation
-        self._gui_poll_id = None   # Track GUI poll timer ID
-
-        # Bind multiple state detection events
-        # self.root.bind('<Visibility>', self.on_visibility_change)
-        self.root.bind('<FocusIn>', self.on_focus_in)
-        self.root.bind('<FocusOut>', self.on_focus_out)
+        self._tick_id = None   # the single Tk timer driving GUI state polling
+
+        self._focused = True  # some widget of this app holds the keyboard focus
+        self._focus_widget = "."  # path of the widget that last took focus
+        self._visibility = "VisibilityUnobscured"
+        self._pending_focus = None  # last (focused, widget) seen since _focus_job was queued
+        self._focus_job = None
+
+        # Bind multiple state detection events; _tick only reads the cached state
+        self.root.bind('<Visibility>', self.on_visibility_change)
+        self.root.bind_all('<FocusIn>', self.on_focus_in, add='+')
+        self.root.bind_all('<FocusOut>', self.on_focus_out, add='+')
         self.root.bind('<Map>', self.on_map)
         self.root.bind('<Unmap>', self.on_unmap)
 
-        # Start the LCD update timer (always 40ms)
-        def lcd_update():
-            if not self._paused.is_set():
-                # Paused, skip this update but reschedule
-                self._lcd_timer_id = self.root.after(40, lcd_update)
-                return
-                
-            if not self.updating_gui:
-                try:
-                    self.update_display_immediately()
-                except Exception as e:
-                    pass
-            # Always schedule next LCD update at 40ms
-            self._lcd_timer_id = self.root.after(40, lcd_update)
-
-        previous_interval = None
-        last_slow_time = 0  # Track when we last went to slow refresh
-        first_poll = True  # Flag for first poll
-
-        def gui_poll():
-            if not self._paused.is_set():
-                # Paused, reschedule with longer delay
-                self._gui_poll_id = self.root.after(200, gui_poll)
-                return
-                
-            nonlocal previous_interval, last_slow_time, first_poll
-            try:
-                # Check focus
-                focus_result = self.root.tk.call("focus")
-                name = str(focus_result) if focus_result else "None"
-                current_time = time.time()
-
-                # On first poll, assume window is visible and focused
-                if first_poll:
-                    first_poll = False
-                    interval = 40
-                    self.gui_should_update = True
-                # Determine if we should use slow or fast polling and whether to update GUI
-                elif self.is_obscured:
-                    # Window is fully obscured
-                    interval = 200
-                    self.gui_should_update = False
-                    last_slow_time = current_time
-                elif name == "None":
-                    interval = 200  # Unfocused/minimized window
-                    self.gui_should_update = False
-                    last_slow_time = current_time
-                elif name.startswith(".__tk_"):
-                    interval = 200  # Filedialog or transient
-                    self.gui_should_update = True  # Keep updating for dialogs
-                    last_slow_time = current_time
-                else:
-                    # If we recently switched to slow polling, stay slow for a bit
-                    if current_time - last_slow_time < 1.0:  # 1 second grace period
-                        interval = 200
-                        self.gui_should_update = False
-                    else:
-                        interval = 40
-                        self.gui_should_update = True
-            except Exception as e:
-                interval = 200
-                self.gui_should_update = False
-                print(f"Exception in gui_poll: {e}")
+        self.last_activity_time = time.monotonic()  # reset by focus/map events and active polls
+        self._first_poll = True  # Flag for first poll
 
-            if interval != previous_interval:
-                previous_interval = interval
+        # Bound once; _tick runs for the lifetime of the app
+        self._running = self._paused.is_set
+        self._after = self.root.after
 
-            self._gui_poll_id = self.root.after(interval, gui_poll)
+        # LCD frames are paced by _update_worker; _tick is the only Tk timer
+        self._tick()
 
-        # Start both timers
-        lcd_update()
-        gui_poll()
+        # The UI, config and draggable items are all in place now
+        self._update_thread.start()
+        self._usb_thread.start()
 
+    def _tick(self):
+        """Poll window state and reschedule at the tier matching recent activity"""
+        if not self._running():
+            # Paused after a USB failure; resume_gui_polling restarts us
+            self._tick_id = None
+            return
+
+        try:
+            # Focus as tracked by the FocusIn/FocusOut bindings
+            name = self._focus_widget if self._focused else "None"
+            current_time = time.monotonic()
+            # Tracked by <Map>/<Unmap>; no Tcl round trip per poll
+            hidden = not self.is_mapped
+
+            # On first poll, assume window is visible and focused
+            if self._first_poll:
+                self._first_poll = False
+                active = True
+                self.gui_should_update = True
+            elif hidden:
+                # Minimized (tray hiding pauses this timer entirely), park at the slowest tier
+                active = False
+                self.gui_should_update = False
+            elif self.is_obscured or name == "None":
+                # Window is fully obscured, unfocused or minimized
+                active = False
+                self.gui_should_update = False
+            elif name.startswith(".__tk_"):
+                # Filedialog or transient
+                active = False
+                self.gui_should_update = True  # Keep updating for dialogs
+            else:
+                active = True
+                self.gui_should_update = True
+
+            if active:
+                self.last_activity_time = current_time
+                interval = self.POLL_INTERVALS[0]
+            elif hidden:
+                interval = self.POLL_INTERVALS[-1]
+            else:
+                # Back off the longer the window has been idle
+                idle = current_time - self.last_activity_time
+                if idle < 1.0:
+                    interval = self.POLL_INTERVALS[1]
+                elif idle < 10.0:
+                    interval = self.POLL_INTERVALS[2]
+                else:
+                    interval = self.POLL_INTERVALS[3]
+        except Exception as e:
+            interval = self.POLL_INTERVALS[1]
+            self.gui_should_update = False
+            print(f"Exception in _tick: {e}")
+
+        self._tick_id = self._after(interval, self._tick)
+
+    def pause_gui_polling(self):
+        """Stop the _tick timer while the window is hidden; the LCD keeps updating"""
+        self.gui_should_update = False
+        if self._tick_id:
+            self.root.after_cancel(self._tick_id)
+            self._tick_id = None
+
+    def resume_gui_polling(self):
+        """Restart the _tick timer if it is not already running"""
+        self.last_activity_time = time.monotonic()
+        if not self._tick_id:
+            self._tick()
+
+    def on_visibility_change(self, event):
+        """Called when the root window becomes obscured or visible"""
+        if str(event.widget) == ".":
+            self._visibility = event.state
+            self.is_obscured = event.state == "VisibilityFullyObscured"
 
     def on_focus_in(self, event):
-        """Called when window gains focus"""
+        """Called when any widget of the app gains focus"""
         # Only set focus if the event is for the root window
         if event.widget == self.root:
             self.has_focus = True
+        self._queue_focus(True, event.widget)
 
     def on_focus_out(self, event):
-        """Called when window loses focus"""
+        """Called when any widget of the app loses focus"""
         # Only clear focus if the event is for the root window
         if event.widget == self.root:
             self.has_focus = False
+        self._queue_focus(False, event.widget)
+
+    def _queue_focus(self, focused, widget):
+        """Record a focus change; only the last one before the loop goes idle is applied"""
+        self._pending_focus = (focused, widget)
+        if self._focus_job is None:
+            self._focus_job = self.root.after_idle(self._apply_focus)
+
+    def _apply_focus(self):
+        self._focus_job = None
+        # A FocusOut followed by a FocusIn means focus only moved within the app
+        focused, widget = self._pending_focus
+        self._focused = focused
+        if focused:
+            self.last_activity_time = time.monotonic()
+            self._focus_widget = str(widget)
 
     def on_map(self, event):
         """Called when window is mapped (shown)"""
@@ -2410,6 +2950,7 @@ class LCDController:
         if widget_str == ".":
             self.is_mapped = True
             self.is_minimized = False
+            self.last_activity_time = time.monotonic()
 
     def on_unmap(self, event):
         """Called when window is unmapped (hidden/minimized)"""
@@ -2422,25 +2963,24 @@ class LCDController:
     def cleanup(self):
         """Stop all threads and timers gracefully"""
         # Cancel timers
-        if hasattr(self, '_lcd_timer_id') and self._lcd_timer_id:
-            try:
-                self.root.after_cancel(self._lcd_timer_id)
-            except:
-                pass
-        
-        if hasattr(self, '_gui_poll_id') and self._gui_poll_id:
+        if hasattr(self, '_tick_id') and self._tick_id:
             try:
-                self.root.after_cancel(self._gui_poll_id)
+                self.root.after_cancel(self._tick_id)
             except:
                 pass
         
         # Stop threads
         self._stop_threads.set()
         self._paused.set()  # Unpause so thread can exit
+        self._update_event.set()  # Wake the update worker now rather than at its next frame
+        with self._usb_cond:
+            self._usb_cond.notify()
         
-        # Wait for thread to finish (with timeout)
+        # Both workers exit at their next wake-up; a USB write in flight is not worth waiting for
         if self._update_thread.is_alive():
-            self._update_thread.join(timeout=1.0)
+            self._update_thread.join(timeout=0.2)
+        if self._usb_thread.is_alive():
+            self._usb_thread.join(timeout=0.2)
 
 
 if __name__ == "__main__":
@@ -2486,61 +3026,80 @@ if __name__ == "__main__":
             except Exception as e:
                 print(f"Warning: could not set iconphoto: {e}", file=sys.stderr)
 
+    # Decoded once for the tray icon
+    tray_image = None
+    if app_icon_path:
+        try:
+            tray_image = Image.open(app_icon_path).copy()
+        except Exception as e:
+            print(f"Warning: could not load tray icon: {e}", file=sys.stderr)
+
     app = LCDController(root, configfile)
 
     # --- System tray support ---
-    tray_icon = None
     first_close = True
 
     def show_window(icon=None, item=None):
         """Restore the main window from the tray."""
-        global tray_icon
-        if tray_icon:
-            tray_icon.stop()
-            tray_icon = None
+        tray_icon.visible = False
         root.deiconify()
         root.lift()
         root.focus_force()
+        root.after(0, app.resume_gui_polling)
 
 
     def quit_app(icon=None, item=None):
         """Exit cleanly."""
-        if icon:
-            icon.stop()
+        tray_icon.stop()
         root.after(0, root.destroy)
 
+    tray_menu = pystray.Menu(
+        pystray.MenuItem("Open", show_window),
+        pystray.MenuItem("Exit", quit_app)
+    )
+
+    # Created and run once; hiding and showing the window only toggles visibility.
+    # The empty setup callback keeps the icon hidden until the first hide.
+    tray_icon = pystray.Icon("tr-driver", tray_image, "TR Driver", tray_menu)
+    threading.Thread(target=tray_icon.run, kwargs={"setup": lambda icon: None}, daemon=True).start()
+
     def hide_window(*_):
-        """Hide the window and show tray icon."""
-        global tray_icon
+        """Hide the window and show tray icon; without a working tray, just minimize."""
         global first_close
+        # Bring the tray icon up first, so the window is never hidden with no way back
+        try:
+            if tray_image is None:
+                raise RuntimeError("no tray icon image")
+            tray_icon.visible = True
+        except Exception as e:
+            print(f"Warning: tray icon unavailable, minimizing instead: {e}", file=sys.stderr)
+            if root.state() != "iconic":
+                root.iconify()
+            return
         if first_close:
             messagebox.showinfo("TR Driver", "Program will run in the background. Use the tray menu to quit")
             first_close = False
         root.withdraw()
-
-        def _run_tray():
-            global tray_icon
-            image = Image.open(app_icon_path) if app_icon_path else None
-            menu = pystray.Menu(
-                pystray.MenuItem("Open", show_window),
-                pystray.MenuItem("Exit", quit_app)
-            )
-            tray_icon = pystray.Icon("tr-driver", image, "TR Driver", menu)
-            tray_icon.run()
-
-        threading.Thread(target=_run_tray, daemon=True).start()
+        app.pause_gui_polling()
 
     # When user clicks the close button:
     root.protocol("WM_DELETE_WINDOW", hide_window)
 
     # Optional: also hide when minimized
     def on_minimize(event):
+        # <Unmap> on root also fires for every child widget that is unmapped
+        if event.widget is not root:
+            return
         if root.state() == "iconic":
             hide_window()
-    root.bind("<Unmap>", on_minimize)
+    root.bind("<Unmap>", on_minimize, add="+")
 
     try:
         root.mainloop()
     finally:
+        try:
+            tray_icon.stop()  # may already be stopped by quit_app
+        except Exception:
+            pass
         app.cleanup()
         lcd_driver.cleanup_dev()
@@ -6,9 +6,97 @@ Drop-in replacement for tkinter.messagebox with matching aesthetics.
 import tkinter as tk
 from tkinter import font as tkfont
 import os
-from PIL import Image, ImageTk
 
-class ThemedMessageBox(tk.Toplevel):
+# Button (background, hover) colours keyed by lower-cased button text
+_BUTTON_COLORS = {
+    "ok": ("#4CAF50", "#45A049"),
+    "yes": ("#4CAF50", "#45A049"),
+    "cancel": ("#f44336", "#da190b"),
+    "no": ("#f44336", "#da190b"),
+}
+_DEFAULT_BUTTON_COLORS = ("#2196F3", "#0b7dda")
+
+
+def _hover_enter(event):
+    event.widget.config(bg=event.widget._hover_color)
+
+
+def _hover_leave(event):
+    event.widget.config(bg=event.widget._bg_color)
+
+_POOL = {}  # (parent path, icon_type) -> hidden ThemedMessageBox waiting to be reused
+
+
+class _ThemedDialog(tk.Toplevel):
+    """Showing logic shared by the themed dialogs: center on the parent, grab input, focus"""
+
+    def _show_when_ready(self, parent, fresh):
+        """Finish showing the dialog once it has been laid out"""
+        self._parent_ref = parent
+        if fresh:
+            # A new window gets a <Configure> once it is mapped and sized
+            self.bind("<Configure>", self._on_first_configure)
+        else:
+            # A reused window may come back at the geometry it had, so no <Configure>
+            # is guaranteed; finish once its new contents are laid out
+            self.after_idle(self._finalize_show, parent)
+
+    def _on_first_configure(self, event):
+        """Finish showing the dialog on its first <Configure>"""
+        if event.widget is not self:
+            return  # children's events propagate to the toplevel's bindings
+        self.unbind("<Configure>")
+        self._finalize_show(self._parent_ref)
+
+    def _finalize_show(self, parent):
+        """Center the laid-out dialog, grab input and focus its default widget"""
+        self._center_on_parent(parent)
+        self._grab()
+        widget = self._focus_widget()
+        if widget is not None:
+            widget.focus_set()
+
+    def _focus_widget(self):
+        """Widget to focus once shown"""
+        return None
+
+    def _grab(self, tries=50):
+        """Grab input, retrying briefly while a just-deiconified window isn't viewable yet"""
+        if self.state() == "withdrawn":
+            return  # closed before it could be grabbed
+        try:
+            self.grab_set()
+        except tk.TclError:
+            if tries:
+                self.after(10, self._grab, tries - 1)
+
+    def _center_on_parent(self, parent):
+        """Center dialog on parent window"""
+        # Requested size is known once packed; no need to force a layout flush
+        dialog_width = self.winfo_reqwidth()
+        dialog_height = self.winfo_reqheight()
+        
+        if parent:
+            # Center on parent
+            parent_x = parent.winfo_rootx()
+            parent_y = parent.winfo_rooty()
+            parent_width = parent.winfo_width()
+            parent_height = parent.winfo_height()
+            
+            x = parent_x + (parent_width - dialog_width) // 2
+            y = parent_y + (parent_height - dialog_height) // 2
+        else:
+            # Center on screen
+            screen_width = self.winfo_screenwidth()
+            screen_height = self.winfo_screenheight()
+            
+            x = (screen_width - dialog_width) // 2
+            y = (screen_height - dialog_height) // 2
+        
+        self.geometry(f"+{x}+{y}")
+
+
+class ThemedMessageBox(_ThemedDialog):
     """Dark-themed message box matching TR Driver style"""
     
     # Icon colors and symbols
@@ -34,35 +122,41 @@ class ThemedMessageBox(tk.Toplevel):
         super().__init__(parent)
         
         self.result = None
+        self._keep = False  # withdraw instead of destroy on close (set for pooled boxes)
+        self._done = tk.BooleanVar(self, value=False)
         self.title(title)
         self.configure(bg="#2b2b2b")
         self.resizable(False, False)
         
         # Make modal
         self.transient(parent)
+        self.protocol("WM_DELETE_WINDOW", lambda: self._on_button_click(None))
+        # Release show() if the window goes away with its parent
+        self.bind("<Destroy>", lambda e: e.widget is self and self._done.set(True))
         
         # Get icon config
         icon_config = self.ICONS.get(icon_type, self.ICONS["info"])
         
+        self._setup_ui(icon_config)
+        self._prepare(message, buttons)
+        self._show_when_ready(parent, fresh=True)
+
+    def _prepare(self, message, buttons):
+        """Fill in message and buttons for the next showing"""
         # Default buttons
         if buttons is None:
             buttons = [("OK", True)]
-        
-        self._setup_ui(message, icon_config, buttons)
-        self._center_on_parent(parent)
-        
-        # Grab focus after window is ready
-        self.update_idletasks()
-        try:
-            self.grab_set()
-        except:
-            pass
-        
-        # Focus first button
-        if hasattr(self, '_buttons') and self._buttons:
-            self._buttons[0].focus_set()
-    
-    def _setup_ui(self, message, icon_config, buttons):
+
+        self.result = None
+        self._done.set(False)
+        self._message_label.config(text=message)
+        self._set_buttons(buttons)
+
+    def _focus_widget(self):
+        """Focus the first button"""
+        return self._buttons[0] if self._buttons else None
+
+    def _setup_ui(self, icon_config):
         """Setup the UI components"""
         # Main container
         main_frame = tk.Frame(self, bg="#2b2b2b")
@@ -83,37 +177,34 @@ class ThemedMessageBox(tk.Toplevel):
         icon_label.pack(side=tk.LEFT, padx=(0, 20))
         
         # Message
-        message_label = tk.Label(
+        self._message_label = tk.Label(
             content_frame,
-            text=message,
             font=("Arial", 11),
             fg="#FFFFFF",
             bg="#2b2b2b",
             justify=tk.LEFT,
             wraplength=400
         )
-        message_label.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self._message_label.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
         # Button frame
-        button_frame = tk.Frame(main_frame, bg="#2b2b2b")
-        button_frame.pack(pady=(10, 0), anchor="center")
-        
+        self._button_frame = tk.Frame(main_frame, bg="#2b2b2b")
+        self._button_frame.pack(pady=(10, 0), anchor="center")
+        self._buttons = []
+
+    def _set_buttons(self, buttons):
+        """Replace the dialog's buttons"""
+        for btn in self._buttons:
+            btn.destroy()
+
         # Create buttons
         self._buttons = []
         for i, (text, return_value) in enumerate(buttons):
             # Color scheme based on button type
-            if text.lower() in ["ok", "yes"]:
-                bg_color = "#4CAF50"
-                hover_color = "#45A049"
-            elif text.lower() in ["cancel", "no"]:
-                bg_color = "#f44336"
-                hover_color = "#da190b"
-            else:
-                bg_color = "#2196F3"
-                hover_color = "#0b7dda"
+            bg_color, hover_color = _BUTTON_COLORS.get(text.lower(), _DEFAULT_BUTTON_COLORS)
             
             btn = tk.Button(
-                button_frame,
+                self._button_frame,
                 text=text,
                 font=("Arial", 10, "bold"),
                 bg=bg_color,
@@ -130,49 +221,55 @@ class ThemedMessageBox(tk.Toplevel):
             self._buttons.append(btn)
             
             # Hover effects
-            btn.bind("<Enter>", lambda e, b=btn, c=hover_color: b.config(bg=c))
-            btn.bind("<Leave>", lambda e, b=btn, c=bg_color: b.config(bg=c))
+            btn._bg_color, btn._hover_color = bg_color, hover_color
+            btn.bind("<Enter>", _hover_enter)
+            btn.bind("<Leave>", _hover_leave)
         
         # Bind Enter and Escape keys
         self.bind("<Return>", lambda e: self._on_button_click(buttons[0][1]))
         if len(buttons) > 1:
             self.bind("<Escape>", lambda e: self._on_button_click(buttons[-1][1]))
+        else:
+            self.unbind("<Escape>")
     
     def _on_button_click(self, value):
         """Handle button click"""
         self.result = value
-        self.destroy()
-    
-    def _center_on_parent(self, parent):
-        """Center dialog on parent window"""
-        self.update_idletasks()
-        
-        # Get dimensions
-        dialog_width = self.winfo_width()
-        dialog_height = self.winfo_height()
-        
-        if parent:
-            # Center on parent
-            parent_x = parent.winfo_rootx()
-            parent_y = parent.winfo_rooty()
-            parent_width = parent.winfo_width()
-            parent_height = parent.winfo_height()
-            
-            x = parent_x + (parent_width - dialog_width) // 2
-            y = parent_y + (parent_height - dialog_height) // 2
+        try:
+            self.grab_release()
+        except:
+            pass
+        self._done.set(True)
+        if self._keep:
+            self.withdraw()
         else:
-            # Center on screen
-            screen_width = self.winfo_screenwidth()
-            screen_height = self.winfo_screenheight()
-            
-            x = (screen_width - dialog_width) // 2
-            y = (screen_height - dialog_height) // 2
-        
-        self.geometry(f"+{x}+{y}")
+            self.destroy()
+
+    @classmethod
+    def show_pooled(cls, parent, title, message, icon_type="info", buttons=None):
+        """Show a message box, reusing a hidden one for the same parent and icon"""
+        key = (str(parent), icon_type)
+        # Taken out of the pool while showing, so a nested box gets its own window
+        dialog = _POOL.pop(key, None)
+        if dialog is None or not dialog.winfo_exists():
+            dialog = cls(parent, title, message, icon_type, buttons)
+            dialog._keep = True
+        else:
+            dialog.title(title)
+            dialog.deiconify()
+            dialog._prepare(message, buttons)
+            dialog._show_when_ready(parent, fresh=False)
+        result = dialog.show()
+        try:
+            if dialog.winfo_exists():
+                _POOL[key] = dialog
+        except tk.TclError:
+            pass  # application already destroyed
+        return result
     
     def show(self):
         """Show dialog and return result"""
-        self.wait_window()
+        self.wait_variable(self._done)
         return self.result
 
 
@@ -180,105 +277,97 @@ class ThemedMessageBox(tk.Toplevel):
 
 def showerror(title, message, parent=None):
     """Show an error message dialog"""
-    dialog = ThemedMessageBox(
+    return ThemedMessageBox.show_pooled(
         parent or tk._default_root,
         title,
         message,
         icon_type="error",
         buttons=[("OK", None)]
     )
-    return dialog.show()
 
 
 def showwarning(title, message, parent=None):
     """Show a warning message dialog"""
-    dialog = ThemedMessageBox(
+    return ThemedMessageBox.show_pooled(
         parent or tk._default_root,
         title,
         message,
         icon_type="warning",
         buttons=[("OK", None)]
     )
-    return dialog.show()
 
 
 def showinfo(title, message, parent=None):
     """Show an info message dialog"""
-    dialog = ThemedMessageBox(
+    return ThemedMessageBox.show_pooled(
         parent or tk._default_root,
         title,
         message,
         icon_type="info",
         buttons=[("OK", None)]
     )
-    return dialog.show()
 
 
 def askquestion(title, message, parent=None):
     """Ask a yes/no question"""
-    dialog = ThemedMessageBox(
+    result = ThemedMessageBox.show_pooled(
         parent or tk._default_root,
         title,
         message,
         icon_type="question",
         buttons=[("Yes", "yes"), ("No", "no")]
     )
-    result = dialog.show()
     return result if result else "no"
 
 
 def askyesno(title, message, parent=None):
     """Ask a yes/no question, returns bool"""
-    dialog = ThemedMessageBox(
+    result = ThemedMessageBox.show_pooled(
         parent or tk._default_root,
         title,
         message,
         icon_type="question",
         buttons=[("Yes", True), ("No", False)]
     )
-    result = dialog.show()
     return result if result is not None else False
 
 
 def askokcancel(title, message, parent=None):
     """Ask OK/Cancel, returns bool"""
-    dialog = ThemedMessageBox(
+    result = ThemedMessageBox.show_pooled(
         parent or tk._default_root,
         title,
         message,
         icon_type="question",
         buttons=[("OK", True), ("Cancel", False)]
     )
-    result = dialog.show()
     return result if result is not None else False
 
 
 def askyesnocancel(title, message, parent=None):
     """Ask Yes/No/Cancel, returns True/False/None"""
-    dialog = ThemedMessageBox(
+    return ThemedMessageBox.show_pooled(
         parent or tk._default_root,
         title,
         message,
         icon_type="question",
         buttons=[("Yes", True), ("No", False), ("Cancel", None)]
     )
-    return dialog.show()
 
 
 def askretrycancel(title, message, parent=None):
     """Ask Retry/Cancel, returns bool"""
-    dialog = ThemedMessageBox(
+    result = ThemedMessageBox.show_pooled(
         parent or tk._default_root,
         title,
         message,
         icon_type="warning",
         buttons=[("Retry", True), ("Cancel", False)]
     )
-    result = dialog.show()
     return result if result is not None else False
 
 
-class ThemedAboutBox(tk.Toplevel):
+class ThemedAboutBox(_ThemedDialog):
     """Dark-themed About dialog matching TR Driver style"""
 
     def __init__(self, parent, app_name, version, description, website=None, icon="ℹ", icon_path=None):
@@ -288,14 +377,27 @@ class ThemedAboutBox(tk.Toplevel):
         self.resizable(False, False)
         self.transient(parent)
 
+        self.protocol("WM_DELETE_WINDOW", self._close)
+
         self._setup_ui(app_name, version, description, website, icon, icon_path)
-        self._center_on_parent(parent)
+        self._show_when_ready(parent, fresh=True)
 
-        self.update_idletasks()
+    def present(self, parent):
+        """Reshow a closed box"""
+        self.deiconify()
+        self._show_when_ready(parent, fresh=False)
+
+    def _focus_widget(self):
+        """Focus OK"""
+        return self._ok_button
+
+    def _close(self):
+        """Hide the dialog so it can be presented again"""
         try:
-            self.grab_set()
+            self.grab_release()
         except:
             pass
+        self.withdraw()
 
     def _setup_ui(self, app_name, version, description, website, icon, icon_path):
         main_frame = tk.Frame(self, bg="#2b2b2b")
@@ -304,6 +406,7 @@ class ThemedAboutBox(tk.Toplevel):
         # --- Icon at top ---
         if icon_path and os.path.exists(icon_path):
             try:
+                from PIL import Image, ImageTk  # only needed for image icons
                 img = Image.open(icon_path).resize((80, 80))
                 self._photo = ImageTk.PhotoImage(img)
                 icon_label = tk.Label(main_frame, image=self._photo, bg="#2b2b2b")
@@ -360,10 +463,11 @@ class ThemedAboutBox(tk.Toplevel):
                 cursor="hand2",
             )
             site_label.pack(pady=(0, 10))
+            import webbrowser
             site_label.bind("<Button-1>", lambda e: webbrowser.open(website))
 
         # --- OK button ---
-        ok_button = tk.Button(
+        self._ok_button = ok_button = tk.Button(
             main_frame,
             text="OK",
             font=("Arial", 10, "bold"),
@@ -375,15 +479,6 @@ class ThemedAboutBox(tk.Toplevel):
             cursor="hand2",
             padx=20,
             pady=8,
-            command=self.destroy,
+            command=self._close,
         )
         ok_button.pack(pady=(10, 0))
-        ok_button.focus_set()
-
-    def _center_on_parent(self, parent):
-        """Center the dialog on its parent window"""
-        self.update_idletasks()
-        if parent is not None:
-            x = parent.winfo_rootx() + (parent.winfo_width() // 2) - (self.winfo_reqwidth() // 2)
-            y = parent.winfo_rooty() + (parent.winfo_height() // 2) - (self.winfo_reqheight() // 2)
-            self.geometry(f"+{x}+{y}")
@@ -59,6 +59,13 @@ SystemInfoPoller::SystemInfoPoller(double fast_interval, double slow_interval)
     info[metric] = 0.0;
   }
 
+  // The CPU count doesn't change while we run, so read it once here rather
+  // than on every slow poll
+  if (info.count("cpu_count"))
+  {
+    info["cpu_count"] = static_cast<double>(std::thread::hardware_concurrency());
+  }
+
   // Initialize CPU tracking for percentage calculation
   _last_cpu_times = get_cpu_times();
   _last_cpu_time = std::chrono::steady_clock::now();
@@ -115,27 +122,33 @@ long long SystemInfoPoller::CpuTimes::active() const
 
 void SystemInfoPoller::_poll_loop()
 {
-  double next_fast = 0;
-  double next_slow = 0;
+  using clock = std::chrono::steady_clock;
+  const auto fast_period =
+      std::chrono::duration_cast<clock::duration>(std::chrono::duration<double>(fast_interval));
+  const auto slow_period =
+      std::chrono::duration_cast<clock::duration>(std::chrono::duration<double>(slow_interval));
+
+  auto next_fast = clock::now();
+  auto next_slow = next_fast;
   while (_running)
   {
-    double now =
-        std::chrono::duration<double>(std::chrono::system_clock::now().time_since_epoch()).count();
+    auto now = clock::now();
 
     if (now >= next_fast)
     {
       auto updated = _poll_fast();
       _merge_info(updated);
-      next_fast = now + fast_interval;
+      next_fast = now + fast_period;
     }
     if (now >= next_slow)
     {
       auto updated = _poll_slow();
       _merge_info(updated);
-      next_slow = now + slow_interval;
+      next_slow = now + slow_period;
     }
 
-    std::this_thread::sleep_for(std::chrono::milliseconds(50));
+    // Sleep straight to whichever poll is due next rather than waking every 50ms
+    std::this_thread::sleep_until(std::min(next_fast, next_slow));
   }
 }
 
@@ -213,15 +226,6 @@ std::unordered_map<std::string, double> SystemInfoPoller::_poll_slow()
 {
   std::unordered_map<std::string, double> out;
 
-  // CPU count
-  try
-  {
-    out["cpu_count"] = static_cast<double>(std::thread::hardware_concurrency());
-  }
-  catch (...)
-  {
-  }
-
   // Disk info
   try
   {
@@ -350,45 +354,56 @@ double SystemInfoPoller::get_cpu_percent()
 
 double SystemInfoPoller::get_cpu_temperature()
 {
-  double max_temp = 0.0;
-
-  // Iterate through hwmon devices to find CPU temperature sensors
-  for (int i = 0; i < 10; ++i)
-  { // Check hwmon0 through hwmon9
-    std::string hwmon_path = "/sys/class/hwmon/hwmon" + std::to_string(i);
-    std::string name_path = hwmon_path + "/name";
+  // hwmon numbering is fixed once the sensor drivers are loaded, so find the
+  // CPU temperature inputs once and only read those afterwards. If none were
+  // found (driver not loaded yet), look again every few minutes.
+  auto now = std::chrono::steady_clock::now();
+  if (_cpu_temp_paths.empty() &&
+      (_cpu_temp_scan_time == std::chrono::steady_clock::time_point{} ||
+       now - _cpu_temp_scan_time > std::chrono::minutes(5)))
+  {
+    _cpu_temp_scan_time = now;
 
-    std::ifstream name_file(name_path);
-    if (!name_file.is_open())
-      continue;
+    // Iterate through hwmon devices to find CPU temperature sensors
+    for (int i = 0; i < 10; ++i)
+    { // Check hwmon0 through hwmon9
+      std::string hwmon_path = "/sys/class/hwmon/hwmon" + std::to_string(i);
+      std::string name_path = hwmon_path + "/name";
 
-    std::string sensor_name;
-    std::getline(name_file, sensor_name);
-    name_file.close();
+      std::ifstream name_file(name_path);
+      if (!name_file.is_open())
+        continue;
 
-    // Check if this is a CPU temperature sensor
-    if (sensor_name == "k10temp" || sensor_name == "coretemp")
-    {
-      // Found CPU sensor, now check for temperature inputs
-      for (int temp_idx = 1; temp_idx <= 5; ++temp_idx)
-      { // Check temp1_input through temp5_input
-        std::string temp_path = hwmon_path + "/temp" + std::to_string(temp_idx) + "_input";
-        std::ifstream temp_file(temp_path);
+      std::string sensor_name;
+      std::getline(name_file, sensor_name);
+      name_file.close();
 
-        if (temp_file.is_open())
-        {
-          int temp_millicelsius;
-          if (temp_file >> temp_millicelsius)
-          {
-            double temp_celsius = temp_millicelsius / 1000.0;
-            max_temp = std::max(max_temp, temp_celsius);
-          }
-          temp_file.close();
+      // Check if this is a CPU temperature sensor
+      if (sensor_name == "k10temp" || sensor_name == "coretemp")
+      {
+        // Found CPU sensor, now check for temperature inputs
+        for (int temp_idx = 1; temp_idx <= 5; ++temp_idx)
+        { // Check temp1_input through temp5_input
+          std::string temp_path = hwmon_path + "/temp" + std::to_string(temp_idx) + "_input";
+          if (std::filesystem::exists(temp_path))
+            _cpu_temp_paths.push_back(temp_path);
         }
       }
     }
   }
 
+  double max_temp = 0.0;
+  for (const auto& temp_path : _cpu_temp_paths)
+  {
+    std::ifstream temp_file(temp_path);
+    int temp_millicelsius;
+    if (temp_file >> temp_millicelsius)
+    {
+      double temp_celsius = temp_millicelsius / 1000.0;
+      max_temp = std::max(max_temp, temp_celsius);
+    }
+  }
+
   return max_temp;
 }
 
@@ -459,34 +474,48 @@ std::pair<double, double> SystemInfoPoller::get_disk_info()
 {
   long long total_bytes = 0, used_bytes = 0, free_bytes = 0;
 
-  // Read mount points from /proc/mounts
-  std::ifstream mounts("/proc/mounts");
-  std::string line;
-
-  while (std::getline(mounts, line))
+  // The set of mounted disks rarely changes, so only re-read and filter
+  // /proc/mounts every few minutes; each poll is then just the statvfs calls
+  auto now = std::chrono::steady_clock::now();
+  if (_disk_mounts_time == std::chrono::steady_clock::time_point{} ||
+      now - _disk_mounts_time > std::chrono::minutes(5))
   {
-    std::istringstream iss(line);
-    std::string device, mountpoint, fstype;
-    iss >> device >> mountpoint >> fstype;
+    _disk_mounts.clear();
+    _disk_mounts_time = now;
 
-    // Skip virtual/temporary filesystems
-    if (fstype == "tmpfs" || fstype == "devtmpfs" || fstype == "proc" || fstype == "sysfs" ||
-        fstype == "cgroup" || fstype == "overlay" || fstype == "squashfs" || fstype == "ramfs" ||
-        fstype.empty())
-    {
-      continue;
-    }
+    std::ifstream mounts("/proc/mounts");
+    std::string line;
 
-    if (device.find("/dev/loop") == 0 || device.find("/dev/sr") == 0)
+    while (std::getline(mounts, line))
     {
-      continue;
-    }
+      std::istringstream iss(line);
+      std::string device, mountpoint, fstype;
+      iss >> device >> mountpoint >> fstype;
 
-    if (mountpoint.find("/run") != std::string::npos)
-    {
-      continue;
+      // Skip virtual/temporary filesystems
+      if (fstype == "tmpfs" || fstype == "devtmpfs" || fstype == "proc" || fstype == "sysfs" ||
+          fstype == "cgroup" || fstype == "overlay" || fstype == "squashfs" || fstype == "ramfs" ||
+          fstype.empty())
+      {
+        continue;
+      }
+
+      if (device.find("/dev/loop") == 0 || device.find("/dev/sr") == 0)
+      {
+        continue;
+      }
+
+      if (mountpoint.find("/run") != std::string::npos)
+      {
+        continue;
+      }
+
+      _disk_mounts.push_back(mountpoint);
     }
+  }
 
+  for (const auto& mountpoint : _disk_mounts)
+  {
     // Get disk usage using statvfs-like approach
     try
     {
@@ -1211,8 +1240,8 @@ ScsiResult send_scsi_command(libusb_device_handle* dev,
 {
   std::vector<uint8_t> data_in;
 
-  // Build CBW
-  std::vector<uint8_t> cbw(31, 0);
+  // Build CBW (fixed 31 bytes, so it lives on the stack)
+  std::array<uint8_t, 31> cbw{};
   cbw[0] = 'U';
   cbw[1] = 'S';
   cbw[2] = 'B';
@@ -1236,17 +1265,21 @@ ScsiResult send_scsi_command(libusb_device_handle* dev,
   cbw[14] = static_cast<uint8_t>(cdb.size());
 
   std::memcpy(cbw.data() + 15, cdb.data(), cdb.size());
-  // Convert CBW vector to hex string for logging
-  std::string cbw_string;
-  for (uint8_t b : cbw)
+  // scsi_log drops everything unless DEBUG, so don't format the dump for nothing
+  if (DEBUG)
   {
-    char buf[3];
-    snprintf(buf, sizeof(buf), "%02x", b);
-    cbw_string += buf;
-    cbw_string += ' ';
+    // Convert CBW vector to hex string for logging
+    std::string cbw_string;
+    for (uint8_t b : cbw)
+    {
+      char buf[3];
+      snprintf(buf, sizeof(buf), "%02x", b);
+      cbw_string += buf;
+      cbw_string += ' ';
+    }
+    scsi_log("CBW: " + cbw_string);
+    scsi_log("CDB data size is " + std::to_string(cdb.size()));
   }
-  scsi_log("CBW: " + cbw_string);
-  scsi_log("CDB data size is " + std::to_string(cdb.size()));
   // Send CBW
   int transferred = 0;
   int rc = libusb_bulk_transfer(dev, 0x02, cbw.data(), cbw.size(), &transferred, 1000);
@@ -1280,7 +1313,7 @@ ScsiResult send_scsi_command(libusb_device_handle* dev,
   result.data = std::move(data_in);
 
   // CSW
-  std::vector<uint8_t> csw(13);
+  std::array<uint8_t, 13> csw{};
   rc = libusb_bulk_transfer(dev, 0x81, csw.data(), csw.size(), &transferred, 1000);
   if (rc != 0 || transferred != 13 || std::memcmp(csw.data(), "USBS", 4) != 0)
   {
@@ -1351,26 +1384,38 @@ bool update_lcd_image(const uint8_t* pil_img, libusb_device_handle* dev)
     return false;
   }
 
-  // Convert to chunks of RGB565
-  auto chunks = ImageConverter::image_to_rgb565_chunks(pil_img);
+  // Convert to chunks of RGB565. The buffers live across frames so steady-state
+  // updates don't allocate; frames are only ever sent from one thread at a time.
+  static std::array<std::vector<uint8_t>, 3> chunks;
+  ImageConverter::fill_rgb565_chunks(pil_img, chunks);
+
+  // Every frame sends the same three chunk indices and lengths, so the CDBs
+  // are built once on the first frame and reused
+  static const std::array<std::vector<uint8_t>, 3> cdbs = [] {
+    std::array<std::vector<uint8_t>, 3> out;
+    for (size_t idx = 0; idx < out.size(); ++idx)
+    {
+      std::vector<uint8_t>& cdb = out[idx];
+      cdb.assign(16, 0);
+      cdb[0] = 0xF5; // Vendor command
+      cdb[1] = 0x01;
+      cdb[2] = 0x01;
+      cdb[3] = static_cast<uint8_t>(idx);
+
+      uint32_t length = static_cast<uint32_t>(chunks[idx].size());
+      // Write length in little-endian
+      cdb[12] = (length) & 0xFF;
+      cdb[13] = (length >> 8) & 0xFF;
+      cdb[14] = (length >> 16) & 0xFF;
+      cdb[15] = (length >> 24) & 0xFF;
+    }
+    return out;
+  }();
 
   for (size_t idx = 0; idx < chunks.size(); ++idx)
   {
-    std::vector<uint8_t> cdb(16, 0);
-    cdb[0] = 0xF5; // Vendor command
-    cdb[1] = 0x01;
-    cdb[2] = 0x01;
-    cdb[3] = static_cast<uint8_t>(idx);
-
-    uint32_t length = static_cast<uint32_t>(chunks[idx].size());
-    // Write length in little-endian
-    cdb[12] = (length) & 0xFF;
-    cdb[13] = (length >> 8) & 0xFF;
-    cdb[14] = (length >> 16) & 0xFF;
-    cdb[15] = (length >> 24) & 0xFF;
-
     {
-      ScsiResult res = send_scsi_command(dev, cdb, chunks[idx]);
+      ScsiResult res = send_scsi_command(dev, cdbs[idx], chunks[idx]);
       if (!res.ok) {
         // USB transfer failed for this chunk — signal failure to caller
         return false;
@@ -1387,37 +1432,117 @@ static inline uint16_t rgb_to_rgb565(uint8_t r, uint8_t g, uint8_t b)
   return ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3);
 }
 
+// Per-channel RGB565 contributions. In the scalar column walk three table loads
+// beat the masks and shifts; the vectorised AVX2 pass keeps the arithmetic.
+struct Rgb565Lut
+{
+  std::array<uint16_t, 256> r{}, g{}, b{};
+  constexpr Rgb565Lut()
+  {
+    for (int i = 0; i < 256; ++i)
+    {
+      r[i] = static_cast<uint16_t>((i & 0xF8) << 8);
+      g[i] = static_cast<uint16_t>((i & 0xFC) << 3);
+      b[i] = static_cast<uint16_t>(i >> 3);
+    }
+  }
+};
+static constexpr Rgb565Lut RGB565_LUT{};
+
+// The panel takes RGB565 little-endian; on LE hosts that is one native 16-bit store
+static inline void store_le16(uint8_t* p, uint16_t v)
+{
+#if defined(__BYTE_ORDER__) && __BYTE_ORDER__ == __ORDER_LITTLE_ENDIAN__
+  std::memcpy(p, &v, sizeof(v));
+#else
+  p[0] = static_cast<uint8_t>(v & 0xFF);
+  p[1] = static_cast<uint8_t>(v >> 8);
+#endif
+}
+
+#if defined(__GNUC__) && defined(__x86_64__)
+#define LCD_HAVE_AVX2_PATH 1
+
+// Contiguous RGB888 -> RGB565 pass, compiled for AVX2 so the 3-byte deinterleave
+// vectorises. Only called after checking the CPU supports it.
+__attribute__((target("avx2"))) static void pack_rgb565_rows_avx2(
+    const uint8_t* __restrict rgb, uint16_t* __restrict out, size_t n_pixels)
+{
+  for (size_t i = 0; i < n_pixels; ++i, rgb += 3)
+    out[i] = rgb_to_rgb565(rgb[0], rgb[1], rgb[2]);
+}
+
+// Pack the whole frame row-major with AVX2, then do the flip/transpose on 16-bit
+// pixels. Roughly twice as fast as the column walk below, which can't be vectorised.
+static void fill_rgb565_chunks_avx2(const uint8_t* image_data,
+                                    std::array<std::vector<uint8_t>, 3>& chunks)
+{
+  thread_local std::vector<uint16_t> frame(WIDTH * HEIGHT);
+  pack_rgb565_rows_avx2(image_data, frame.data(), frame.size());
+
+  std::array<int, 3> chunk_widths = {120, 120, 80};
+  int start = 0;
+
+  for (size_t i = 0; i < chunk_widths.size(); ++i)
+  {
+    int w = chunk_widths[i];
+    chunks[i].resize(w * HEIGHT * 2);
+    uint8_t* out = chunks[i].data();
+    for (int col = 0; col < w; ++col)
+    {
+      const uint16_t* px = frame.data() + (HEIGHT - 1) * WIDTH + start + col;
+      for (int row = 0; row < HEIGHT; ++row, px -= WIDTH)
+      {
+        store_le16(out, *px);
+        out += 2;
+      }
+    }
+    start += w;
+  }
+}
+#endif
+
 std::array<std::vector<uint8_t>, 3> ImageConverter::image_to_rgb565_chunks(
     const uint8_t* image_data)
 {
   std::array<std::vector<uint8_t>, 3> chunks;
+  fill_rgb565_chunks(image_data, chunks);
+  return chunks;
+}
+
+void ImageConverter::fill_rgb565_chunks(const uint8_t* image_data,
+                                        std::array<std::vector<uint8_t>, 3>& chunks)
+{
+#ifdef LCD_HAVE_AVX2_PATH
+  static const bool has_avx2 = __builtin_cpu_supports("avx2");
+  if (has_avx2)
+  {
+    fill_rgb565_chunks_avx2(image_data, chunks);
+    return;
+  }
+#endif
+
   std::array<int, 3> chunk_widths = {120, 120, 80};
   int start = 0;
 
   for (size_t i = 0; i < chunk_widths.size(); ++i)
   {
     int w = chunk_widths[i];
-    chunks[i].reserve(w * HEIGHT * 2); // preallocate
+    chunks[i].resize(w * HEIGHT * 2); // no-op when the caller reuses its buffers
+    uint8_t* out = chunks[i].data();
     for (int col = 0; col < w; ++col)
     {
-      int ac = start + col;
-      for (int row = 0; row < HEIGHT; ++row)
+      // Walk each column bottom-up: the panel wants the image flipped vertically
+      const uint8_t* px = image_data + ((HEIGHT - 1) * WIDTH + start + col) * 3; // RGB stride
+      for (int row = 0; row < HEIGHT; ++row, px -= WIDTH * 3)
       {
-        int flipped = HEIGHT - 1 - row;
-        int idx = (flipped * WIDTH + ac) * 3; // RGB stride
-        uint8_t r = image_data[idx + 0];
-        uint8_t g = image_data[idx + 1];
-        uint8_t b = image_data[idx + 2];
-
-        uint16_t rgb565 = rgb_to_rgb565(r, g, b);
-        chunks[i].push_back(static_cast<uint8_t>(rgb565 & 0xFF));
-        chunks[i].push_back(static_cast<uint8_t>((rgb565 >> 8) & 0xFF));
+        store_le16(out, static_cast<uint16_t>(RGB565_LUT.r[px[0]] | RGB565_LUT.g[px[1]] |
+                                              RGB565_LUT.b[px[2]]));
+        out += 2;
       }
     }
     start += w;
   }
-
-  return chunks;
 }
 
 void BackgroundManager::set_background_paths(const std::string& image, const std::string& video)
@@ -1426,6 +1551,16 @@ void BackgroundManager::set_background_paths(const std::string& image, const std
   video_path = video;
 }
 
+// INTER_AREA averages source pixels when shrinking, which is both the right
+// filter for downscaling and much cheaper than Lanczos; keep Lanczos for the
+// rare image or clip smaller than the panel
+static void resize_to_panel(const cv::Mat& frame, cv::Mat& out)
+{
+  bool shrinking = frame.cols >= WIDTH && frame.rows >= HEIGHT;
+  cv::resize(frame, out, cv::Size(WIDTH, HEIGHT), 0, 0,
+             shrinking ? cv::INTER_AREA : cv::INTER_LANCZOS4);
+}
+
 cv::Mat BackgroundManager::create_default_background()
 {
   if (default_bg.empty())
@@ -1444,7 +1579,8 @@ cv::Mat BackgroundManager::create_default_background()
       cv::line(default_bg, cv::Point(0, y), cv::Point(320, y), cv::Scalar(val, val / 2, val));
     }
   }
-  return default_bg.clone();
+  // Shared, not cloned: every caller only reads the background
+  return default_bg;
 }
 
 cv::Mat BackgroundManager::load_static_background(const std::string& background_path)
@@ -1467,8 +1603,9 @@ cv::Mat BackgroundManager::load_static_background(const std::string& background_
       }
       has_alpha = (img.channels() == 4);
 
-      cv::resize(img, img, cv::Size(320, 240));
-      static_bg = img;
+      cv::Mat resized;
+      resize_to_panel(img, resized);
+      static_bg = resized;
       static_bg_path = background_path;
       static_bg_mtime = current_mtime;
     }
@@ -1477,7 +1614,8 @@ cv::Mat BackgroundManager::load_static_background(const std::string& background_
       return cv::Mat();
     }
   }
-  return static_bg.clone();
+  // Shared, not cloned: callers only read it, and a reload assigns a fresh Mat
+  return static_bg;
 }
 
 cv::Mat BackgroundManager::get_background(const std::string& video_path,
@@ -1585,24 +1723,43 @@ cv::Mat BackgroundManager::compose_with_video(const cv::Mat& argb_image, const c
   return blended_bgra;
 }
 
-std::vector<uint8_t> BackgroundManager::get_background_bytes(const std::string& video_path,
-                                                             const std::string& image_path)
+const cv::Mat& BackgroundManager::get_background_rgb(const std::string& video_path,
+                                                     const std::string& image_path)
 {
   cv::Mat bg = get_background(video_path, image_path);
   if (bg.empty())
   {
-    return std::vector<uint8_t>();
+    rgb_source.release();
+    rgb_frame.release();
+    return rgb_frame;
   }
 
-  cv::Mat bytes_mat;
+  // The GUI polls faster than most videos advance, so the same source frame
+  // is often asked for twice. Holding a reference to it keeps its buffer
+  // alive, so a matching data pointer really is the same frame.
+  if (bg.data == rgb_source.data && !rgb_frame.empty())
+  {
+    return rgb_frame;
+  }
 
-  // Convert static BGR image to RGB
-  cv::cvtColor(bg, bytes_mat, cv::COLOR_BGRA2RGB);
+  // Convert BGRA to RGB into the persistent frame; cvtColor reuses its buffer
+  // when the size and type are unchanged, so no per-frame allocation
+  cv::cvtColor(bg, rgb_frame, cv::COLOR_BGRA2RGB);
+  rgb_source = bg;
+  return rgb_frame;
+}
+
+std::vector<uint8_t> BackgroundManager::get_background_bytes(const std::string& video_path,
+                                                             const std::string& image_path)
+{
+  const cv::Mat& rgb = get_background_rgb(video_path, image_path);
+  if (rgb.empty())
+  {
+    return std::vector<uint8_t>();
+  }
 
   // Convert to raw bytes (same as PIL's .tobytes())
-  std::vector<uint8_t> bytes;
-  bytes.assign(bytes_mat.datastart, bytes_mat.dataend);
-  return bytes;
+  return std::vector<uint8_t>(rgb.datastart, rgb.dataend);
 }
 
 BackgroundManager& get_background_manager()
@@ -1662,14 +1819,16 @@ void VideoBackground::_init()
 
 cv::Mat VideoBackground::get_current_frame()
 {
+  // Frames are never written after they are published, so handing out a
+  // shared header is safe and avoids a full-frame copy per call
   std::lock_guard<std::mutex> lock(_lock);
   if (_streaming)
   {
-    return _current_frame.clone();
+    return _current_frame;
   }
   else if (!_frames.empty())
   {
-    return _frames[_frame_index].clone();
+    return _frames[_frame_index];
   }
   return cv::Mat();
 }
@@ -1686,14 +1845,25 @@ size_t VideoBackground::get_frame_count() const
 
 void VideoBackground::_preload_frames()
 {
+  // Playback runs at _fps, so from a faster clip only keep the frames that line
+  // up with it. grab() advances without converting or copying the frame out,
+  // so the skipped ones only cost the decode itself.
+  double src_fps = cap.get(cv::CAP_PROP_FPS);
+  double step = (src_fps > _fps) ? src_fps / _fps : 1.0;
+  double next_keep = 0.0;
+
   cv::Mat frame;
-  while (cap.read(frame))
+  for (size_t index = 0; cap.grab(); ++index)
   {
-    if (frame.empty())
+    if (index < next_keep)
+      continue;
+    next_keep += step;
+
+    if (!cap.retrieve(frame) || frame.empty())
       break;
     cv::Mat resized;
-    cv::resize(frame, resized, cv::Size(320, 240), 0, 0, cv::INTER_LANCZOS4);
-    _frames.push_back(resized.clone());
+    resize_to_panel(frame, resized);
+    _frames.push_back(resized);
   }
   cap.release();
 }
@@ -1712,9 +1882,14 @@ void VideoBackground::_play_loop()
 
 void VideoBackground::_stream_loop()
 {
+  using clock = std::chrono::steady_clock;
   double fps = cap.get(cv::CAP_PROP_FPS);
-  int delay = (fps > 0) ? static_cast<int>(1000.0 / fps) : 41;
+  const auto period = std::chrono::duration_cast<clock::duration>(
+      std::chrono::duration<double>((fps > 0) ? 1.0 / fps : 1.0 / 24));
 
+  // Sleep to a deadline rather than a fixed delay so decode time doesn't
+  // stretch every frame
+  auto next_frame = clock::now();
   cv::Mat frame;
   while (_playing)
   {
@@ -1725,45 +1900,66 @@ void VideoBackground::_stream_loop()
     }
 
     cv::Mat resized;
-    cv::resize(frame, resized, cv::Size(320, 240), 0, 0, cv::INTER_LANCZOS4);
+    resize_to_panel(frame, resized);
 
     {
       std::lock_guard<std::mutex> lock(_lock);
-      _current_frame = resized.clone();
+      _current_frame = resized; // fresh buffer each iteration, no copy needed
     }
 
-    std::this_thread::sleep_for(std::chrono::milliseconds(delay));
+    // If decoding fell behind, carry on from now instead of rushing to catch up
+    next_frame = std::max(next_frame + period, clock::now());
+    std::this_thread::sleep_until(next_frame);
   }
 }
 
 void VideoBackground::_preloaded_loop()
 {
-  while (_playing && !_frames.empty())
+  if (_frames.empty())
+    return;
+
+  // Precompute the playback order once: "loop" walks 0..N-1, "bounce" walks
+  // 0..N-1..1, and any other mode holds the current frame
+  const size_t count = _frames.size();
+  size_t current;
+  {
+    std::lock_guard<std::mutex> lock(_lock);
+    current = _frame_index;
+  }
+  std::vector<size_t> schedule;
+  if (mode == "loop" || mode == "bounce")
+  {
+    for (size_t i = 0; i < count; ++i)
+      schedule.push_back(i);
+    if (mode == "bounce")
+    {
+      for (size_t i = count - 1; i-- > 1;)
+        schedule.push_back(i);
+    }
+  }
+  else
+  {
+    schedule.push_back(current);
+  }
+
+  using clock = std::chrono::steady_clock;
+  const auto period = std::chrono::duration_cast<clock::duration>(
+      std::chrono::duration<double>(1.0 / _fps));
+
+  // Resume from the frame that is showing now rather than jumping back to the start
+  size_t step = std::find(schedule.begin(), schedule.end(), current) - schedule.begin();
+  if (step == schedule.size())
+    step = 0;
+  auto next_frame = clock::now();
+  while (_playing)
   {
+    step = (step + 1) % schedule.size();
     {
       std::lock_guard<std::mutex> lock(_lock);
-      if (mode == "loop")
-      {
-        _frame_index = (_frame_index + 1) % _frames.size();
-      }
-      else if (mode == "bounce")
-      {
-        if (_forward)
-        {
-          _frame_index++;
-          if (_frame_index >= _frames.size() - 1)
-            _forward = false;
-        }
-        else
-        {
-          if (_frame_index > 0)
-            _frame_index--;
-          if (_frame_index <= 0)
-            _forward = true;
-        }
-      }
+      _frame_index = schedule[step];
     }
-    std::this_thread::sleep_for(std::chrono::milliseconds(1000 / _fps));
+    next_frame = std::max(next_frame + period, clock::now());
+    std::this_thread::sleep_until(next_frame);
   }
 }
 
@@ -1965,3 +2161,19 @@ void ConfigManager::update_config_value(const std::string& key, const nlohmann::
 {
   set_value(key, value);
 }
+
+void ConfigManager::update_config_bulk(const nlohmann::json& values)
+{
+  // Replace each top-level key, same as update_config_value() per key
+  if (values.is_object())
+    _data.update(values);
+}
+
+void ConfigManager::update_config_values(const nlohmann::json& values)
+{
+  // Dotted key -> value, same as update_config_value() per key
+  if (!values.is_object())
+    return;
+  for (auto it = values.begin(); it != values.end(); ++it)
+    set_value(it.key(), it.value());
+}
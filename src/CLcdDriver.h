@@ -86,6 +86,12 @@ private:
   CpuTimes _last_cpu_times;
   std::chrono::steady_clock::time_point _last_cpu_time;
 
+  std::vector<std::string> _disk_mounts;
+  std::chrono::steady_clock::time_point _disk_mounts_time;
+
+  std::vector<std::string> _cpu_temp_paths;
+  std::chrono::steady_clock::time_point _cpu_temp_scan_time;
+
   // NVML constants
   static constexpr int NVML_SUCCESS = 0;
   static constexpr int NVML_TEMPERATURE_GPU = 0;
@@ -131,6 +137,8 @@ class ImageConverter
 public:
   // Preallocated version: caller gets three chunks already filled
   static std::array<std::vector<uint8_t>, 3> image_to_rgb565_chunks(const uint8_t* pixels_rgb);
+  // Same conversion into caller-owned buffers, reused frame to frame without reallocating
+  static void fill_rgb565_chunks(const uint8_t* pixels_rgb, std::array<std::vector<uint8_t>, 3>& chunks);
 
 private:
   static inline uint16_t rgb_to_rgb565(uint8_t r, uint8_t g, uint8_t b)
@@ -147,7 +155,6 @@ public:
       mode(mode),
       _fps(target_fps),
       _frame_index(0),
-      _forward(true),
       _playing(false),
       _streaming(false)
   {
@@ -169,7 +176,6 @@ private:
   int _fps;
   std::vector<cv::Mat> _frames;
   size_t _frame_index;
-  bool _forward;
   bool _playing;
   bool _streaming;
   std::thread _thread;
@@ -189,6 +195,7 @@ class BackgroundManager
 {
 public:
   std::vector<uint8_t> get_background_bytes(const std::string& video_path = "", const std::string& image_path = "");
+  const cv::Mat& get_background_rgb(const std::string& video_path = "", const std::string& image_path = "");
 
 private:
   cv::Mat create_default_background();
@@ -202,6 +209,8 @@ private:
   std::time_t static_bg_mtime;
   std::unique_ptr<VideoBackground> video_bg = nullptr;
   cv::Mat default_bg;
+  cv::Mat rgb_frame;
+  cv::Mat rgb_source;
   bool has_alpha = false;
   std::string image_path;
   std::string video_path;
@@ -221,6 +230,8 @@ public:
     bool load_config_from_defaults();
     nlohmann::json get_config() const { return _data; }  // Returns a copy, auto-converts to Python dict
     void update_config_value(const std::string& key, const nlohmann::json& value);
+    void update_config_bulk(const nlohmann::json& values);
+    void update_config_values(const nlohmann::json& values);
     bool save_config(const std::string& path) const;
 
 private:
@@ -25,6 +25,8 @@ PYBIND11_MODULE(lcd_driver, m) {
         .def("get_config", &ConfigManager::get_config)
         .def("load_config_from_defaults", &ConfigManager::load_config_from_defaults)
         .def("update_config_value", &ConfigManager::update_config_value)
+        .def("update_config_bulk", &ConfigManager::update_config_bulk)
+        .def("update_config_values", &ConfigManager::update_config_values)
         .def("save_config", &ConfigManager::save_config);
 
 
@@ -37,9 +39,12 @@ PYBIND11_MODULE(lcd_driver, m) {
             const std::string &video_path,
             const std::string &image_path)
          {
-             auto vec = self.get_background_bytes(video_path, image_path);
-             return py::bytes(reinterpret_cast<const char *>(vec.data()),
-                              vec.size());
+             // Copy straight from the persistent RGB frame into the bytes object
+             const cv::Mat &rgb = self.get_background_rgb(video_path, image_path);
+             if (rgb.empty())
+                 return py::bytes();
+             return py::bytes(reinterpret_cast<const char *>(rgb.data),
+                              rgb.total() * rgb.elemSize());
          },
          py::arg("video_path") = "",
          py::arg("image_path") = "");
@@ -54,6 +59,8 @@ PYBIND11_MODULE(lcd_driver, m) {
         if (info.ndim != 1)
             throw std::runtime_error("Expected a 1D contiguous buffer");
         const uint8_t* data_ptr = static_cast<const uint8_t*>(info.ptr);
+        // USB transfer doesn't touch Python objects; let the render thread run meanwhile
+        py::gil_scoped_release release;
         return update_lcd_image(data_ptr); // default dev is nullptr
     });
 }